@@ -1,7 +1,9 @@
 """Streaming agent loop for Alfred."""
 
+import asyncio
 import json
 import logging
+import re
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from time import perf_counter
@@ -13,8 +15,22 @@ from alfred.tools import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# In-band markers emitted by LLMProvider.stream_chat_with_tools
+_USAGE_MARKER = "[USAGE]"
+_TOOL_CALLS_MARKER = "[TOOL_CALLS]"
+_REASONING_MARKER = "[REASONING]"
+_STREAM_MARKERS = (_USAGE_MARKER, _TOOL_CALLS_MARKER, _REASONING_MARKER)
 
-@dataclass
+# Substrings that mark tool output as an error, matched in a single pass
+_ERROR_INDICATORS = ("Error:", "Exception:", "Traceback", "Failed", "❌")
+_ERROR_PATTERN = re.compile("|".join(map(re.escape, _ERROR_INDICATORS)))
+
+# Tool output is coalesced into one ToolOutput event per this many chars or seconds
+TOOL_OUTPUT_FLUSH_CHARS = 256
+TOOL_OUTPUT_FLUSH_SECONDS = 0.05
+
+
+@dataclass(slots=True)
 class ToolCall:
     """A parsed tool call from LLM."""
 
@@ -26,7 +42,7 @@ class ToolCall:
 # Tool event types for callback-based rendering
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolEvent:
     """Base event for tool execution."""
 
@@ -34,21 +50,21 @@ class ToolEvent:
     tool_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolStart(ToolEvent):
     """Tool started executing."""
 
     arguments: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolOutput(ToolEvent):
     """Chunk of tool output."""
 
     chunk: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolEnd(ToolEvent):
     """Tool finished."""
 
@@ -56,6 +72,51 @@ class ToolEnd(ToolEvent):
     is_error: bool = False
 
 
+class _ToolOutputBatcher:
+    """Coalesce streamed tool output chunks into fewer ToolOutput events.
+
+    Chunks are held until TOOL_OUTPUT_FLUSH_CHARS accumulate or
+    TOOL_OUTPUT_FLUSH_SECONDS pass, whichever comes first, so a tool that
+    streams many tiny chunks doesn't trigger a re-render per chunk.
+    """
+
+    def __init__(self, call: ToolCall, tool_callback: Callable[[ToolEvent], None] | None) -> None:
+        self._call = call
+        self._tool_callback = tool_callback
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def add(self, chunk: str) -> None:
+        """Buffer a chunk, flushing once the size threshold is reached."""
+        if self._tool_callback is None:
+            return
+        self._pending.append(chunk)
+        self._pending_chars += len(chunk)
+        if self._pending_chars >= TOOL_OUTPUT_FLUSH_CHARS:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(TOOL_OUTPUT_FLUSH_SECONDS, self.flush)
+
+    def flush(self) -> None:
+        """Emit any buffered output as a single ToolOutput event."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending or self._tool_callback is None:
+            return
+        chunk = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        self._tool_callback(
+            ToolOutput(
+                tool_call_id=self._call.id,
+                tool_name=self._call.name,
+                chunk=chunk,
+            )
+        )
+
+
 class Agent:
     """Streaming agent - coordinates LLM and tool execution."""
 
@@ -110,25 +171,20 @@ class Agent:
                 )
             )
 
-        tool_output = ""
+        output_parts: list[str] = []
+        output_batcher = _ToolOutputBatcher(call, tool_callback)
         try:
             async for chunk in tool.validate_and_run_stream(call.arguments):
                 chunk_count += 1
-                tool_output += chunk
-                # Emit output event
-                if tool_callback:
-                    tool_callback(
-                        ToolOutput(
-                            tool_call_id=call.id,
-                            tool_name=call.name,
-                            chunk=chunk,
-                        )
-                    )
+                output_parts.append(chunk)
+                # Emit output events in batches
+                output_batcher.add(chunk)
         except Exception as e:
             encountered_error = True
             error_type = type(e).__name__
             error_msg = f"Error executing {call.name}: {e}"
-            tool_output += error_msg
+            output_parts.append(error_msg)
+            output_batcher.flush()
             if tool_callback:
                 tool_callback(
                     ToolOutput(
@@ -137,6 +193,10 @@ class Agent:
                         chunk=error_msg,
                     )
                 )
+        finally:
+            output_batcher.flush()
+
+        tool_output = "".join(output_parts)
 
         # Only mark as error if an actual exception was raised during execution
         # Content-based error detection causes false positives (e.g., reading error logs)
@@ -187,14 +247,19 @@ class Agent:
         Yields:
             - LLM response tokens as they arrive
         """
+        # Private working list: assistant/tool turns are appended below and
+        # must not leak into the caller's history
+        working: list[ChatMessage] = []
         if system_prompt:
-            messages = [ChatMessage(role="system", content=system_prompt)] + messages
+            working.append(ChatMessage(role="system", content=system_prompt))
+        working.extend(messages)
+        messages = working
 
         iteration = 0
 
         while self.max_iterations == -1 or iteration < self.max_iterations:
             iteration += 1
-            logger.debug(f"Agent iteration {iteration}")
+            logger.debug("Agent iteration %d", iteration)
 
             # Get tool schemas
             tool_schemas = self.tools.get_schemas()
@@ -205,39 +270,33 @@ class Agent:
                 tools=tool_schemas if tool_schemas else None,
             )
 
-            full_content = ""
+            # Collect parts and join once; += would copy the whole response per token
+            content_parts: list[str] = []
             tool_calls_data: list[dict[str, Any]] = []
             in_tool_call = False
-            reasoning_content: str | None = None
+            reasoning_parts: list[str] = []
             in_reasoning = False
 
             async for chunk in stream:
-                # Check for usage marker
-                if chunk.startswith("[USAGE]"):
-                    try:
-                        usage_data = json.loads(chunk[7:])
-                        if usage_callback:
-                            usage_callback(usage_data)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse usage data: {chunk}")
-                    continue
-
-                # Check for tool call markers in stream
-                if chunk.startswith("[TOOL_CALLS]"):
-                    try:
-                        tc_data = json.loads(chunk[12:])
-                        tool_calls_data = tc_data
-                        in_tool_call = True
-                    except json.JSONDecodeError:
-                        pass
-                    continue
-
-                # Check for reasoning content marker
-                if chunk.startswith("[REASONING]"):
-                    in_reasoning = True
-                    chunk_reasoning = chunk[11:]
-                    reasoning_content = (reasoning_content or "") + chunk_reasoning
-                    yield chunk  # Forward reasoning to client
+                # Content tokens rarely start with "[", so most skip the marker checks
+                if chunk[:1] == "[" and chunk.startswith(_STREAM_MARKERS):
+                    if chunk.startswith(_USAGE_MARKER):
+                        try:
+                            usage_data = json.loads(chunk[len(_USAGE_MARKER) :])
+                            if usage_callback:
+                                usage_callback(usage_data)
+                        except json.JSONDecodeError:
+                            logger.warning("Failed to parse usage data: %s", chunk)
+                    elif chunk.startswith(_TOOL_CALLS_MARKER):
+                        try:
+                            tool_calls_data = json.loads(chunk[len(_TOOL_CALLS_MARKER) :])
+                            in_tool_call = True
+                        except json.JSONDecodeError:
+                            pass
+                    else:
+                        in_reasoning = True
+                        reasoning_parts.append(chunk[len(_REASONING_MARKER) :])
+                        yield chunk  # Forward reasoning to client
                     continue
 
                 # Regular content - check if we need to end reasoning
@@ -246,7 +305,7 @@ class Agent:
                         # End reasoning mode before regular content
                         in_reasoning = False
                         yield "[/REASONING]"
-                    full_content += chunk
+                    content_parts.append(chunk)
                     yield chunk
 
             # Check if we have tool calls
@@ -254,32 +313,27 @@ class Agent:
                 # No tool calls, we're done
                 return
 
-            # Parse tool calls
-            tool_calls = [
-                ToolCall(
-                    id=tc.get("id", f"call_{i}"),
-                    name=tc["function"]["name"],
-                    arguments=json.loads(tc["function"]["arguments"]),
+            # Parse tool calls. The provider already emits OpenAI-shaped dicts,
+            # so fill in any missing fields and echo them back unchanged
+            tool_calls = []
+            for i, tc in enumerate(tool_calls_data):
+                tc.setdefault("id", f"call_{i}")
+                tc.setdefault("type", "function")
+                tool_calls.append(
+                    ToolCall(
+                        id=tc["id"],
+                        name=tc["function"]["name"],
+                        arguments=json.loads(tc["function"]["arguments"]),
+                    )
                 )
-                for i, tc in enumerate(tool_calls_data)
-            ]
 
             # Add assistant message with tool calls and reasoning
             assistant_msg = ChatMessage(
                 role="assistant",
-                content=full_content,
-                tool_calls=[
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in tool_calls
-                ],
+                content="".join(content_parts),
+                tool_calls=tool_calls_data,
             )
+            reasoning_content = "".join(reasoning_parts)
             if reasoning_content:
                 assistant_msg.reasoning_content = reasoning_content
             messages.append(assistant_msg)
@@ -333,14 +387,7 @@ class Agent:
 
     def _is_error(self, output: str) -> bool:
         """Detect if tool output indicates an error."""
-        error_indicators = [
-            "Error:",
-            "Exception:",
-            "Traceback",
-            "Failed",
-            "❌",
-        ]
-        return any(indicator in output for indicator in error_indicators)
+        return _ERROR_PATTERN.search(output) is not None
 
     async def run(
         self,
@@ -353,7 +400,5 @@ class Agent:
         Returns:
             Complete response as string
         """
-        result = ""
-        async for chunk in self.run_stream(messages, system_prompt, tool_callback=tool_callback):
-            result += chunk
-        return result
+        parts = [chunk async for chunk in self.run_stream(messages, system_prompt, tool_callback=tool_callback)]
+        return "".join(parts)
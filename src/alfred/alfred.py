@@ -4,17 +4,18 @@ import asyncio
 import logging
 from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
+from functools import lru_cache
 from time import perf_counter
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
-from telegram import Bot
+from pydantic import BaseModel
 
 from alfred.agent import Agent, ToolEnd, ToolEvent, ToolOutput, ToolStart
 from alfred.config import Config
 from alfred.context import ContextLoader
 from alfred.core import AlfredCore
-from alfred.llm import ChatMessage
+from alfred.llm import ChatMessage, preload_token_encoder
 from alfred.self_model import RuntimeSelfModel, build_runtime_self_model
 from alfred.session import Message, ReasoningBlock, Role, Session, TextBlock, ToolCallRecord
 from alfred.support_policy import SupportPolicyRuntime, render_support_behavior_contract
@@ -22,9 +23,30 @@ from alfred.support_reflection import SupportReflectionRuntime
 from alfred.token_tracker import TokenTracker
 from alfred.tools import get_registry, register_builtin_tools
 
+if TYPE_CHECKING:
+    from telegram import Bot
+
 # Default prompt sections loaded by ContextLoader
 DEFAULT_PROMPT_SECTIONS = ["AGENTS", "SOUL", "USER", "TOOLS"]
 
+# Static text around the rendered tool list in the system prompt
+_TOOLS_PROMPT_HEADER = """
+
+## Available Tools
+
+You have access to the following tools. Use them when needed to accomplish the user's request.
+
+"""
+_TOOLS_PROMPT_FOOTER = """
+
+To use a tool, respond with a tool call. The system will execute the tool
+and return the results to you.
+You can then continue the conversation with the tool results.
+"""
+
+# Minimum spacing between partial-message snapshots while a turn streams
+PARTIAL_SNAPSHOT_INTERVAL_SECONDS = 0.05
+
 
 class ContextSummary:
     """Summary of loaded context for status display."""
@@ -43,11 +65,23 @@ class ContextSummary:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _param_summary(param_model: type[BaseModel]) -> str:
+    """Render a parameter model as ``name: type`` pairs, once per model class."""
+    param_list = []
+    for name, field in param_model.model_fields.items():
+        ann = field.annotation
+        param_type = (getattr(ann, "__name__", None) or str(ann)) if ann else "any"
+        param_list.append(f"{name}: {param_type.lower()}")
+    return ", ".join(param_list)
+
+
 class Alfred:
     """Core Alfred engine - handles memory, context, LLM, and agent loop."""
 
     def __init__(self, config: Config, telegram_mode: bool = False) -> None:
         self.config = config
+        self._model_name = f"{config.default_llm_provider}/{config.chat_model}"
 
         # Initialize core services (shared with LittleAlfred)
         self.core = AlfredCore(config)
@@ -55,14 +89,9 @@ class Alfred:
         # Initialize UI-specific components
         self.context_loader = ContextLoader(config, store=self.core.sqlite_store)
 
-        # Initialize Telegram bot if in telegram mode
+        # Telegram bot client is created on first use (see telegram_bot)
+        self._telegram_mode = telegram_mode
         self._telegram_bot: Bot | None = None
-        if telegram_mode:
-            try:
-                self._telegram_bot = Bot(token=config.telegram_bot_token)
-                logger.info("Telegram bot initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Telegram bot: {e}")
 
         # Create socket client for cron job tools
         from alfred.cron.socket_client import SocketClient
@@ -80,6 +109,8 @@ class Alfred:
             summarizer=self.core.summarizer,
         )
         self.tools = get_registry()
+        # Rendered tool list for the system prompt, keyed by registry version
+        self._tools_section: tuple[int, str] | None = None
 
         # Create agent with LLM from core
         self.agent = Agent(self.core.llm, self.tools, max_iterations=-1)
@@ -91,10 +122,23 @@ class Alfred:
         # Context summary for status display
         self.context_summary = ContextSummary()
 
+    @property
+    def telegram_bot(self) -> "Bot | None":
+        """Get the Telegram bot client, creating it on first access in telegram mode."""
+        if self._telegram_bot is None and self._telegram_mode:
+            from telegram import Bot
+
+            try:
+                self._telegram_bot = Bot(token=self.config.telegram_bot_token)
+                logger.info("Telegram bot initialized")
+            except Exception as e:
+                logger.warning(f"Failed to initialize Telegram bot: {e}")
+        return self._telegram_bot
+
     @property
     def model_name(self) -> str:
         """Get full model display name (provider/model)."""
-        return f"{self.config.default_llm_provider}/{self.config.chat_model}"
+        return self._model_name
 
     def _on_usage(self, usage: dict[str, Any]) -> None:
         """Callback for LLM usage updates."""
@@ -110,14 +154,6 @@ class Alfred:
         else:
             logger.debug(event)
 
-    @staticmethod
-    def _estimate_tokens(text: str) -> int:
-        """Estimate token count from character count.
-
-        Uses 4 chars per token as rough approximation.
-        """
-        return len(text) // 4
-
     def sync_token_tracker_from_session(self, session_id: str | None = None) -> None:
         """Sync token tracker with historical session messages.
 
@@ -161,7 +197,7 @@ class Alfred:
         )
 
     def _update_context_tokens(self, system_prompt: str, messages: list[ChatMessage]) -> None:
-        """Update context token estimate.
+        """Update context token estimate at roughly 4 characters per token.
 
         Args:
             system_prompt: Full system prompt text
@@ -173,7 +209,7 @@ class Alfred:
             if msg.tool_calls:
                 total_chars += len(str(msg.tool_calls))
 
-        self.token_tracker.set_context_tokens(self._estimate_tokens(system_prompt + str(messages)))
+        self.token_tracker.set_context_tokens(total_chars // 4)
 
     async def chat(self, message: str) -> str:
         """Process a message with full agent loop (non-streaming).
@@ -327,45 +363,41 @@ class Alfred:
                 session = maybe_session
             resolved_session_id = session.meta.session_id
 
-            messages_list = self.core.session_manager.get_session_messages(session_id)
-            user_message_id: str | None = None
-            if reuse_user_message and messages_list:
-                last_message = messages_list[-1]
-                if last_message.role is Role.USER:
-                    user_msg_idx = last_message.idx
-                    user_message_id = last_message.id
-                    msg_count = len(messages_list)
-                    logger.debug(f"Reusing user message. Session has {msg_count} messages")
-                else:
-                    self.core.session_manager.add_message("user", message, session_id=session_id)
-                    messages_list = self.core.session_manager.get_session_messages(session_id)
-                    user_msg_idx = messages_list[-1].idx if messages_list else 0
-                    user_message_id = messages_list[-1].id if messages_list else None
-                    msg_count = len(messages_list)
-                    logger.debug(f"Added user message. Session now has {msg_count} messages")
+            # Read the session's live message list rather than copying it per lookup
+            messages_list = session.messages
+            if reuse_user_message and messages_list and messages_list[-1].role is Role.USER:
+                logger.debug("Reusing user message. Session has %d messages", len(messages_list))
             else:
                 self.core.session_manager.add_message("user", message, session_id=session_id)
-                messages_list = self.core.session_manager.get_session_messages(session_id)
-                user_msg_idx = messages_list[-1].idx if messages_list else 0
-                user_message_id = messages_list[-1].id if messages_list else None
-                msg_count = len(messages_list)
-                logger.debug(f"Added user message. Session now has {msg_count} messages")
+                logger.debug("Added user message. Session now has %d messages", len(messages_list))
+            user_msg_idx = messages_list[-1].idx if messages_list else 0
+            user_message_id: str | None = messages_list[-1].id if messages_list else None
 
             assistant_msg_obj: Message | None = None
 
             boundary = "embedding"
             if status_callback:
                 status_callback("Embedding")
-            # Get query embedding for memory search
-            logger.debug("Generating query embedding...")
-            query_embedding = await self.core.embedder.embed(message)
-
-            if status_callback:
-                status_callback("Loading memories")
-            # Load all memories
-            logger.debug("Loading memories...")
-            all_memories = await self.core.memory_store.get_all_entries()
-            logger.info(f"Loaded {len(all_memories)} memories from store")
+            user_message = messages_list[-1] if messages_list else None
+
+            async def _get_query_embedding() -> list[float]:
+                # Reuse the user message's embedding when a retried turn already persisted one
+                if user_message is not None and user_message.embedding is not None and user_message.content == message:
+                    return user_message.embedding
+                logger.debug("Generating query embedding...")
+                return await self.core.embedder.embed(message)
+
+            # The embedding is network-bound and the memory count is a local query,
+            # so run them concurrently. Memory search itself runs against the vector
+            # index; only the count is needed here.
+            query_embedding, available_memories = await asyncio.gather(
+                _get_query_embedding(),
+                self.core.memory_store.count_entries(),
+            )
+            logger.info("%d memories available in store", available_memories)
+            # Store the query vector on the user message so later persists skip re-embedding it
+            if user_message is not None and user_message.embedding is None and user_message.content == message:
+                user_message.embedding = query_embedding
 
             if status_callback:
                 status_callback("Assembling context")
@@ -378,13 +410,13 @@ class Alfred:
             self._log_turn_event(
                 "core.context.start",
                 turn_id=turn_id,
-                available_memories=len(all_memories),
+                available_memories=available_memories,
                 session_messages=len(session_messages),
             )
             context_started_at = perf_counter()
             system_prompt, memories_count = await self.context_loader.assemble_with_search(
                 query_embedding=query_embedding,
-                memories=all_memories,
+                available_memories=available_memories,
                 session_messages=session_messages,
                 session_messages_with_tools=session_messages_with_tools,
                 alfred=self,
@@ -447,6 +479,7 @@ class Alfred:
             chunk_count = 0
             tool_calls_accumulator: list[dict[str, Any]] = []
             full_response: list[str] = []
+            response_chars = 0  # Running length of full_response
             reasoning_blocks: list[ReasoningBlock] = []  # Interleaved reasoning blocks
             current_reasoning_block: ReasoningBlock | None = None
             text_blocks: list[TextBlock] = []  # Ordered visible text segments
@@ -499,6 +532,19 @@ class Alfred:
                     for tc in tool_calls_accumulator
                 ]
 
+            def _refresh_partial_snapshot() -> None:
+                if assistant_msg_obj is None:
+                    return
+
+                reasoning_parts = [rb.content for rb in reasoning_blocks]
+                if current_reasoning_block is not None:
+                    reasoning_parts.append(current_reasoning_block.content)
+                assistant_msg_obj.content = "".join(full_response)
+                assistant_msg_obj.reasoning_content = "".join(reasoning_parts)
+                assistant_msg_obj.reasoning_blocks = _build_reasoning_blocks_snapshot()
+                assistant_msg_obj.text_blocks = _build_text_blocks_snapshot()
+                assistant_msg_obj.streaming = True
+
             def _tool_callback_wrapper(event: ToolEvent) -> None:
                 """Wrapper to capture tool calls while still calling external callback."""
                 nonlocal full_response, sequence_counter, reasoning_blocks, current_reasoning_block, current_text_block
@@ -519,7 +565,7 @@ class Alfred:
                     current_text_block = None
 
                     # Calculate insert position based on current response length
-                    insert_position = len("".join(full_response))
+                    insert_position = response_chars
 
                     # Assign sequence from shared counter and increment
                     sequence = sequence_counter
@@ -551,12 +597,12 @@ class Alfred:
 
                 if persist_partial and assistant_msg_obj is not None:
                     assistant_msg_obj.tool_calls = _build_tool_calls_snapshot()
-                    assistant_msg_obj.reasoning_blocks = _build_reasoning_blocks_snapshot()
-                    assistant_msg_obj.text_blocks = _build_text_blocks_snapshot()
+                    _refresh_partial_snapshot()
 
             chunk_times: list[float] = []
             last_chunk_time = perf_counter()
             stream_start = perf_counter()
+            last_snapshot_at = float("-inf")
 
             async for chunk in self.agent.run_stream(
                 messages,
@@ -585,12 +631,6 @@ class Alfred:
 
                     # Reasoning boundaries break the current visible text segment.
                     current_text_block = None
-
-                    if assistant_msg_obj is not None:
-                        assistant_msg_obj.reasoning_content += reasoning_chunk
-                        assistant_msg_obj.reasoning_blocks = _build_reasoning_blocks_snapshot()
-                        assistant_msg_obj.text_blocks = _build_text_blocks_snapshot()
-                        assistant_msg_obj.streaming = True
                 elif chunk.startswith("[/REASONING]"):
                     # End current reasoning block
                     if current_reasoning_block is not None:
@@ -599,12 +639,9 @@ class Alfred:
 
                     # Keep the next visible text chunk in a fresh block.
                     current_text_block = None
-
-                    if assistant_msg_obj is not None:
-                        assistant_msg_obj.reasoning_blocks = _build_reasoning_blocks_snapshot()
-                        assistant_msg_obj.text_blocks = _build_text_blocks_snapshot()
                 else:
                     full_response.append(chunk)
+                    response_chars += len(chunk)
                     if current_text_block is None:
                         current_text_block = TextBlock(
                             content=chunk,
@@ -615,16 +652,17 @@ class Alfred:
                     else:
                         current_text_block.content += chunk
 
-                    if assistant_msg_obj is not None:
-                        assistant_msg_obj.content = "".join(full_response)
-                        assistant_msg_obj.text_blocks = _build_text_blocks_snapshot()
-                        assistant_msg_obj.reasoning_blocks = _build_reasoning_blocks_snapshot()
-                        assistant_msg_obj.streaming = True
+                # Rebuilding the partial message re-joins everything streamed so far,
+                # so coalesce snapshots instead of paying that cost on every chunk.
+                # The final assignment after the loop always carries the full turn.
+                if assistant_msg_obj is not None and now - last_snapshot_at >= PARTIAL_SNAPSHOT_INTERVAL_SECONDS:
+                    _refresh_partial_snapshot()
+                    last_snapshot_at = now
                 chunk_count += 1
 
                 # Log slow chunks (>100ms) at debug level
                 if chunk_latency > 0.1:
-                    logger.debug(f"[STREAM_SLOW_CHUNK] chunk={chunk_count} latency={chunk_latency * 1000:.2f}ms chars={len(chunk)}")
+                    logger.debug("[STREAM_SLOW_CHUNK] chunk=%d latency=%.2fms chars=%d", chunk_count, chunk_latency * 1000, len(chunk))
 
                 yield chunk
 
@@ -703,8 +741,7 @@ class Alfred:
                 self.core.session_manager._spawn_persist_task(session.meta.session_id, session.messages)
 
             assistant_msg_idx = assistant_msg_obj.idx
-            msg_count = len(session.messages)
-            logger.debug(f"Added assistant message. Session now has {msg_count} messages")
+            logger.debug("Added assistant message. Session now has %d messages", len(session.messages))
 
             if should_save_support_attempt:
                 if user_message_id is None:
@@ -804,38 +841,22 @@ class Alfred:
 
     def _build_system_prompt(self, base_prompt: str) -> str:
         """Build system prompt with tool descriptions."""
+        version = self.tools.version
+        if self._tools_section is None or self._tools_section[0] != version:
+            self._tools_section = (version, self._render_tools_section())
+        return "".join((base_prompt, _TOOLS_PROMPT_HEADER, self._tools_section[1], _TOOLS_PROMPT_FOOTER))
+
+    def _render_tools_section(self) -> str:
+        """Render one line per registered tool with its parameter summary."""
         tool_descriptions = []
         for tool in self.tools.list_tools():
-            # Get parameter summary
             params = tool.param_model
             if params:
-                param_list = []
-                for name, field in params.model_fields.items():
-                    param_type = "any"
-                    if hasattr(field, "annotation") and field.annotation:
-                        ann = field.annotation
-                        param_type = ann.__name__.lower() if hasattr(ann, "__name__") else str(ann).lower()
-                    param_list.append(f"{name}: {param_type}")
-
-                params_str = ", ".join(param_list)
-                tool_descriptions.append(f"- {tool.name}({params_str}): {tool.description}")
+                tool_descriptions.append(f"- {tool.name}({_param_summary(params)}): {tool.description}")
             else:
                 tool_descriptions.append(f"- {tool.name}: {tool.description}")
 
-        tools_section = "\n".join(tool_descriptions)
-
-        return f"""{base_prompt}
-
-## Available Tools
-
-You have access to the following tools. Use them when needed to accomplish the user's request.
-
-{tools_section}
-
-To use a tool, respond with a tool call. The system will execute the tool
-and return the results to you.
-You can then continue the conversation with the tool results.
-"""
+        return "\n".join(tool_descriptions)
 
     def _get_support_policy_runtime(self) -> SupportPolicyRuntime | None:
         """Return the cached support-policy runtime when the core exposes the required seams."""
@@ -995,13 +1016,24 @@ You can then continue the conversation with the tool results.
         CLI/Telegram instances do not run cron, but they do connect
         to the daemon's socket for job management.
         """
-        # Start socket client for cron job tools
+        # Independent startup I/O runs concurrently
+        await asyncio.gather(self._start_socket_client(), self._preload_token_encoder())
+
+    async def _start_socket_client(self) -> None:
+        """Start socket client for cron job tools."""
         try:
             await self._socket_client.start()
             logger.debug("Socket client started for cron job tools")
         except Exception as e:
             logger.warning(f"Failed to start socket client: {e}")
 
+    async def _preload_token_encoder(self) -> None:
+        """Warm the LLM token encoder so the first turn doesn't load it on the event loop."""
+        try:
+            await preload_token_encoder()
+        except Exception as e:
+            logger.warning(f"Failed to preload token encoder: {e}")
+
     def build_self_model(self) -> RuntimeSelfModel:
         """Build a self-model snapshot from current runtime state.
 
@@ -10,17 +10,18 @@ from __future__ import annotations
 import asyncio
 import functools
 from collections.abc import Callable, Coroutine
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 
-from alfred.config import load_config
-from alfred.cron.socket_client import SocketClient
-from alfred.cron.store import CronStore
+# Config, cron storage, and rich renderables are imported inside the commands
+# that use them, so `alfred --help` and completions skip loading them.
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from alfred.cron.socket_client import SocketClient
+    from alfred.cron.store import CronStore
 
 app = typer.Typer(name="cron", help="Manage cron jobs", no_args_is_help=True)
 console = Console()
@@ -40,13 +41,24 @@ def async_command[T](func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..
 
 def get_socket_client() -> SocketClient:
     """Get a socket client connected to the TUI."""
+    from alfred.cron.socket_client import SocketClient
+
     return SocketClient()
 
 
+@functools.cache
+def _get_data_dir() -> Path:
+    """Resolve the data directory from config once per process."""
+    from alfred.config import load_config
+
+    return load_config().data_dir
+
+
 def get_store() -> CronStore:
     """Get a direct store connection."""
-    config = load_config()
-    return CronStore(config.data_dir)
+    from alfred.cron.store import CronStore
+
+    return CronStore(_get_data_dir())
 
 
 def is_daemon_running() -> bool:
@@ -205,6 +217,8 @@ async def list_jobs(
         console.print(f"[yellow]{msg}[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Cron Jobs ({status_filter})" if status_filter != "all" else "Cron Jobs")
     table.add_column("ID", style="dim", width=8)
     table.add_column("Name", style="bold")
@@ -289,6 +303,8 @@ async def run():
         await store.save_job(job)
         return job.job_id
 
+    from rich.panel import Panel
+
     try:
         job_id = await try_socket_first(_via_socket, _via_store)
         console.print(
@@ -350,6 +366,9 @@ async def review_job(job_id: str = typer.Argument(..., help="Job ID or name")) -
         console.print(f"[red]Error loading job: {e}[/red]")
         raise typer.Exit(1) from e
 
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     console.print(
         Panel(
             f"[bold]{job.get('name', '')}[/bold]\n"
@@ -424,6 +443,8 @@ async def approve_job(job_id: str = typer.Argument(..., help="Job ID or name"))
             raise RuntimeError(result.get("message", "Unknown error"))
         return job.name, "approved"
 
+    from rich.panel import Panel
+
     try:
         job_name, status = await try_socket_first(_via_socket, _via_store)
         if status == "already_active":
@@ -474,6 +495,8 @@ async def reject_job(job_id: str = typer.Argument(..., help="Job ID or name")) -
         await store.delete_job(job.job_id)
         return str(job.name)
 
+    from rich.panel import Panel
+
     try:
         job_name = await try_socket_first(_via_socket, _via_store)
         console.print(
@@ -526,6 +549,8 @@ async def show_history(
             console.print(f"[yellow]No history found{' for job ' + job_id if job_id else ''}.[/yellow]")
             return
 
+        from rich.table import Table
+
         table = Table(title="Execution History")
         table.add_column("Time", width=16)
         table.add_column("Job ID", width=8)
@@ -565,49 +590,46 @@ async def show_history(
         await client.stop()
 
 
-def _find_job_dict(jobs: list[dict[str, Any]], identifier: str) -> dict[str, Any] | None:
-    """Find job by ID or fuzzy name match."""
+def _find_job[J](
+    jobs: list[J],
+    identifier: str,
+    job_id_of: Callable[[J], str | None],
+    name_of: Callable[[J], str],
+) -> J | None:
+    """Find a job by ID or fuzzy name match in a single pass.
+
+    Precedence: exact ID, ID prefix, exact name (case-insensitive), then a
+    name substring match that must be unique.
+    """
     identifier_lower = identifier.lower()
+    prefix_match: J | None = None
+    name_match: J | None = None
+    substring_matches: list[J] = []
 
-    # Try exact ID match
     for job in jobs:
-        if job.get("job_id") == identifier:
+        job_id = job_id_of(job)
+        if job_id == identifier:
             return job
+        if prefix_match is None and (job_id or "").startswith(identifier):
+            prefix_match = job
+        name_lower = name_of(job).lower()
+        if name_match is None and name_lower == identifier_lower:
+            name_match = job
+        if identifier_lower in name_lower:
+            substring_matches.append(job)
 
-    # Try partial ID match
-    for job in jobs:
-        if job.get("job_id", "").startswith(identifier):
-            return job
+    if prefix_match is not None:
+        return prefix_match
+    if name_match is not None:
+        return name_match
+    return substring_matches[0] if len(substring_matches) == 1 else None
 
-    # Try exact name match
-    for job in jobs:
-        if job.get("name", "").lower() == identifier_lower:
-            return job
 
-    # Try substring name match (must be unique)
-    matches = [j for j in jobs if identifier_lower in j.get("name", "").lower()]
-    return matches[0] if len(matches) == 1 else None
+def _find_job_dict(jobs: list[dict[str, Any]], identifier: str) -> dict[str, Any] | None:
+    """Find job by ID or fuzzy name match."""
+    return _find_job(jobs, identifier, lambda job: job.get("job_id"), lambda job: job.get("name", ""))
 
 
 def _find_job_model(jobs: list[Any], identifier: str) -> Any | None:
     """Find job model by ID or fuzzy name match."""
-    identifier_lower = identifier.lower()
-
-    # Try exact ID match
-    for job in jobs:
-        if job.job_id == identifier:
-            return job
-
-    # Try partial ID match
-    for job in jobs:
-        if job.job_id.startswith(identifier):
-            return job
-
-    # Try exact name match
-    for job in jobs:
-        if job.name.lower() == identifier_lower:
-            return job
-
-    # Try substring name match (must be unique)
-    matches = [j for j in jobs if identifier_lower in j.name.lower()]
-    return matches[0] if len(matches) == 1 else None
+    return _find_job(jobs, identifier, lambda job: job.job_id, lambda job: job.name)
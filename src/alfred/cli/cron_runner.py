@@ -24,6 +24,7 @@ from alfred.cron.daemon_server import DaemonSocketServer
 from alfred.cron.scheduler import CronScheduler
 from alfred.cron.store import CronStore
 from alfred.data_manager import get_cache_dir
+from alfred.utils.async_helpers import event_loop_factory, install_default_executor
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,8 @@ async def run_scheduler(
         daemon_manager: Daemon manager for signal handling
         core: AlfredCore with registered services for system jobs
     """
+    install_default_executor(config.io_thread_pool_size)
+
     data_dir = config.data_dir
     store = CronStore(data_dir)
 
@@ -89,20 +92,16 @@ async def run_scheduler(
 
     # Track background tasks to prevent "Task was destroyed but it is pending" warnings
     _background_tasks: set[asyncio.Task[None]] = set()
+    stop = asyncio.Event()
 
-    # Set up signal handlers
-    def _on_shutdown() -> None:
-        task = asyncio.create_task(_shutdown(scheduler, socket_server))
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
-
+    # Set up signal handlers; shutdown itself runs once, in the finally below
     def _on_reload() -> None:
         task = asyncio.create_task(scheduler.reload_jobs())
         _background_tasks.add(task)
         task.add_done_callback(_background_tasks.discard)
 
     daemon_manager.setup_signals(
-        on_shutdown=_on_shutdown,
+        on_shutdown=stop.set,
         on_reload=_on_reload,
     )
 
@@ -117,12 +116,7 @@ async def run_scheduler(
         await scheduler.start()
 
         # Keep running until shutdown
-        while not daemon_manager.shutdown_requested:
-            # Check for reload requests
-            if daemon_manager.reload_requested:
-                await scheduler.reload_jobs()
-
-            await asyncio.sleep(1.0)
+        await stop.wait()
 
     finally:
         await _shutdown(scheduler, socket_server)
@@ -215,7 +209,7 @@ def main() -> int:
 
     # Run the scheduler
     try:
-        asyncio.run(run_scheduler(config, daemon_mgr, core))
+        asyncio.run(run_scheduler(config, daemon_mgr, core), loop_factory=event_loop_factory())
         return 0
     except KeyboardInterrupt:
         logger.info("Interrupted")
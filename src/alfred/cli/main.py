@@ -17,6 +17,7 @@ from rich.console import Console
 # Import cron app directly (lightweight, no heavy deps at import time)
 from alfred.cli.cron import app as cron_app
 from alfred.observability import configure_logging
+from alfred.utils.async_helpers import event_loop_factory, install_default_executor
 
 if TYPE_CHECKING:
     from alfred.alfred import Alfred
@@ -97,7 +98,7 @@ def main(
 
     # If no subcommand, run interactive chat
     if ctx.invoked_subcommand is None:
-        asyncio.run(_run_interactive())
+        asyncio.run(_run_interactive(), loop_factory=event_loop_factory())
 
 
 # ============================================================================
@@ -466,6 +467,7 @@ async def _run_interactive() -> None:
 
     init_xdg_directories()
     config = load_config()
+    install_default_executor(config.io_thread_pool_size)
 
     alfred = Alfred(config, telegram_mode=_run_telegram)
 
@@ -793,7 +795,7 @@ def _setup_logging(
 
 
 def run_async(coro_factory: Callable[[], Coroutine[Any, Any, None]]) -> None:
-    asyncio.run(coro_factory())
+    asyncio.run(coro_factory(), loop_factory=event_loop_factory())
 
 
 if __name__ == "__main__":
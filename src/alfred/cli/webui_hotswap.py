@@ -136,7 +136,7 @@ def _build_server_controller(host: str, port: int, debug: bool = False) -> _Serv
 
     asyncio.run(_start_alfred())
 
-    app = create_app(alfred_instance=cast(Any, alfred), debug=debug)
+    app = create_app(alfred_instance=cast(Any, alfred), debug=debug, io_thread_pool_size=config.io_thread_pool_size)
     app.state.webui_bootstrap_result = bootstrap_result
 
     server = uvicorn.Server(
@@ -63,6 +63,9 @@ class Config(BaseSettings):
     # UI/TUI settings
     use_markdown_rendering: bool = True
 
+    # Async runtime settings
+    io_thread_pool_size: int = 32  # Default executor size for file/tool offloads
+
 
 def _load_toml_config(toml_path: Path) -> dict[str, Any]:
     """Load and flatten TOML config to flat dict.
@@ -103,6 +106,11 @@ def _load_toml_config(toml_path: Path) -> dict[str, Any]:
         if "warning_threshold" in memory:
             flat_config["memory_warning_threshold"] = memory["warning_threshold"]
 
+    if "runtime" in toml_data:
+        runtime = toml_data["runtime"]
+        if "io_threads" in runtime:
+            flat_config["io_thread_pool_size"] = runtime["io_threads"]
+
     # Tool calls configuration
     if "context" in toml_data:
         context = toml_data["context"]
@@ -234,7 +234,7 @@ class ContextBuilder:
     async def build_context(
         self,
         query_embedding: list[float],
-        memories: list[MemoryEntry],
+        available_memories: int,
         system_prompt: str,
         session_messages: list[tuple[str, str]] | None = None,
         session_messages_with_tools: list[Any] | None = None,
@@ -250,14 +250,18 @@ class ContextBuilder:
         tool_message_count = len(session_messages_with_tools or [])
         logger.debug(
             "core.context.start available_memories=%s session_messages=%s tool_messages=%s memory_budget=%s",
-            len(memories),
+            available_memories,
             session_message_count,
             tool_message_count,
             self.memory_budget,
         )
 
-        # Search and deduplicate
-        relevant, similarities, scores = await self.search_memories(query_embedding, top_k=10)
+        # Search and deduplicate; an empty store cannot match, so skip the vector query
+        relevant: list[MemoryEntry] = []
+        similarities: dict[str, float] = {}
+        scores: dict[str, float] = {}
+        if available_memories > 0:
+            relevant, similarities, scores = await self.search_memories(query_embedding, top_k=10)
 
         # Build memory section
         memory_section = self._format_memories(relevant, similarities, scores)
@@ -295,7 +299,7 @@ class ContextBuilder:
                 self.memory_budget,
                 token_count,
                 truncated_count,
-                len(memories),
+                available_memories,
                 session_message_count,
                 (perf_counter() - started_at) * 1000,
             )
@@ -635,10 +639,17 @@ class ContextLoader:
             raise FileNotFoundError(f"Required context file missing: {path}")
 
         loop = asyncio.get_running_loop()
-        raw_content = await loop.run_in_executor(None, path.read_text, "utf-8")
         stat = await loop.run_in_executor(None, path.stat)
         last_modified = datetime.fromtimestamp(stat.st_mtime)
 
+        # Only files without managed prompt includes are cached, so an
+        # unchanged mtime means the content can be reused without a read
+        if cached is not None and cached.last_modified == last_modified:
+            self._clear_blocked_context_file(name)
+            return self._refresh_context_file(cached)
+
+        raw_content = await loop.run_in_executor(None, path.read_text, "utf-8")
+
         managed_prompt_dependencies = await loop.run_in_executor(
             None,
             self._template_manager.collect_managed_prompt_dependencies,
@@ -661,10 +672,6 @@ class ContextLoader:
             self._record_blocked_context_file(name)
             return blocked
 
-        if cached is not None and cached.last_modified == last_modified and not managed_prompt_dependencies:
-            self._clear_blocked_context_file(name)
-            return self._refresh_context_file(cached)
-
         static_content = resolve_all(raw_content, self.config.workspace_dir, resolve_volatile=False)
         refresh_on_load = has_volatile_placeholder(static_content)
 
@@ -678,7 +685,11 @@ class ContextLoader:
         )
 
         self._clear_blocked_context_file(name)
-        self._cache.set(name, cached_file)
+        # Included prompt fragments can change without touching this file's mtime
+        if managed_prompt_dependencies:
+            self._cache.invalidate(name)
+        else:
+            self._cache.set(name, cached_file)
         return self._refresh_context_file(cached_file)
 
     async def load_all(self) -> dict[str, ContextFile]:
@@ -777,7 +788,7 @@ class ContextLoader:
     async def assemble_with_search(
         self,
         query_embedding: list[float],
-        memories: list[Any],
+        available_memories: int,
         session_messages: list[tuple[str, str]] | None = None,
         session_messages_with_tools: list[Any] | None = None,
         alfred: "Alfred | None" = None,
@@ -786,7 +797,7 @@ class ContextLoader:
 
         Args:
             query_embedding: Embedding vector for semantic search
-            memories: Available memories to include
+            available_memories: Number of memories in the store, for diagnostics
             session_messages: Current session message history
             session_messages_with_tools: Session messages with tool calls
             alfred: Optional Alfred instance to include self-model
@@ -820,7 +831,7 @@ class ContextLoader:
 
         return await self._context_builder.build_context(
             query_embedding=query_embedding,
-            memories=memories,
+            available_memories=available_memories,
             system_prompt=system_prompt,
             session_messages=session_messages,
             session_messages_with_tools=session_messages_with_tools,
@@ -3,13 +3,13 @@
 Provides daemonization, PID file management, and signal handling.
 """
 
+import asyncio
 import logging
 import os
 import signal
 import sys
 from collections.abc import Callable
 from pathlib import Path
-from types import FrameType
 
 from alfred.data_manager import get_cache_dir
 
@@ -25,9 +25,13 @@ class DaemonManager:
     Usage:
         daemon = DaemonManager()
 
-        # In daemon process:
-        daemon.write_pid()
-        daemon.setup_signals(on_shutdown=my_shutdown_handler)
+        # In daemon process, from inside the async entry point:
+        async def main():
+            daemon.write_pid()
+            daemon.setup_signals(on_shutdown=my_shutdown_handler)
+            ...
+
+        asyncio.run(main())
 
         # To check/control:
         daemon.is_running()
@@ -37,8 +41,6 @@ class DaemonManager:
     def __init__(self) -> None:
         """Initialize daemon manager."""
         self.pid_file = get_cache_dir() / PID_FILE
-        self._shutdown_requested = False
-        self._reload_requested = False
 
     @property
     def pid(self) -> int:
@@ -181,46 +183,34 @@ class DaemonManager:
     ) -> None:
         """Set up signal handlers for the daemon.
 
+        Handlers are registered on the running event loop, so callbacks run as
+        ordinary loop callbacks rather than interrupting arbitrary code. Must be
+        called from inside the loop.
+
         Args:
             on_shutdown: Callback for SIGTERM/SIGINT
             on_reload: Callback for SIGHUP
         """
+        loop = asyncio.get_running_loop()
 
-        def handle_shutdown(signum: int, _frame: FrameType | None) -> None:
+        def handle_shutdown(sig: signal.Signals) -> None:
             """Handle shutdown signals (SIGTERM, SIGINT)."""
-            sig_name = signal.Signals(signum).name
-            logger.info(f"Received {sig_name}, initiating shutdown...")
-            self._shutdown_requested = True
+            logger.info(f"Received {sig.name}, initiating shutdown...")
             if on_shutdown:
                 on_shutdown()
 
-        def handle_reload(signum: int, _frame: FrameType | None) -> None:
+        def handle_reload() -> None:
             """Handle reload signal (SIGHUP)."""
             logger.info("Received SIGHUP, reloading jobs...")
-            self._reload_requested = True
             if on_reload:
                 on_reload()
 
-        signal.signal(signal.SIGTERM, handle_shutdown)
-        signal.signal(signal.SIGINT, handle_shutdown)
-        signal.signal(signal.SIGHUP, handle_reload)
+        loop.add_signal_handler(signal.SIGTERM, handle_shutdown, signal.SIGTERM)
+        loop.add_signal_handler(signal.SIGINT, handle_shutdown, signal.SIGINT)
+        loop.add_signal_handler(signal.SIGHUP, handle_reload)
 
         logger.debug("Signal handlers configured")
 
-    @property
-    def shutdown_requested(self) -> bool:
-        """Check if shutdown was requested via signal."""
-        return self._shutdown_requested
-
-    @property
-    def reload_requested(self) -> bool:
-        """Check if reload was requested via signal."""
-        # Auto-clear the flag when checked
-        if self._reload_requested:
-            self._reload_requested = False
-            return True
-        return False
-
 
 def daemonize(
     stdout_log: Path | None = None,
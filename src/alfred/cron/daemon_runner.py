@@ -10,6 +10,7 @@ import signal
 
 from alfred.core import AlfredCore
 from alfred.cron.daemon_config import load_daemon_config, setup_logging
+from alfred.utils.async_helpers import event_loop_factory, install_default_executor
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class AlfredDaemon:
 
     Example:
         daemon = AlfredDaemon()
-        asyncio.run(daemon.run())
+        asyncio.run(daemon.run(), loop_factory=event_loop_factory())
     """
 
     def __init__(self) -> None:
@@ -64,6 +65,7 @@ class AlfredDaemon:
         Starts the cron scheduler and waits for shutdown signal.
         """
         logger.info("Starting AlfredDaemon...")
+        install_default_executor(self.config.io_thread_pool_size)
 
         # Create shutdown event and setup signal handlers
         self._shutdown_event = asyncio.Event()
@@ -86,7 +88,7 @@ class AlfredDaemon:
 def main() -> None:
     """Entry point for CLI: `alfred cron daemon`."""
     daemon = AlfredDaemon()
-    asyncio.run(daemon.run())
+    asyncio.run(daemon.run(), loop_factory=event_loop_factory())
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ from typing import Literal
 from alfred.cron.scheduler import CronScheduler
 from alfred.cron.socket_protocol import (
     SOCKET_NAME,
+    STREAM_LIMIT,
     ApproveJobRequest,
     ApproveJobResponse,
     JobCompletedMessage,
@@ -77,6 +78,7 @@ class DaemonSocketServer:
         self._server = await asyncio.start_unix_server(
             self._handle_client,
             path=str(self.socket_path),
+            limit=STREAM_LIMIT,
         )
         os.chmod(self.socket_path, 0o600)
 
@@ -87,12 +89,12 @@ class DaemonSocketServer:
         """Stop the socket server."""
         self._running = False
 
-        # Close all client connections
-        for writer in list(self._clients):
-            writer.close()
-            with contextlib.suppress(Exception):
-                await writer.wait_closed()
+        # Close all client connections, then wait for them together
+        writers = list(self._clients)
         self._clients.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
 
         if self._server:
             self._server.close()
@@ -117,11 +119,10 @@ class DaemonSocketServer:
                     break
 
                 try:
-                    data = line.decode("utf-8").strip()
-                    if not data:
+                    if line.isspace():
                         continue
 
-                    message = SocketMessage.from_json(data)
+                    message = SocketMessage.from_json(line)
                     await self._dispatch_message(message, writer)
 
                 except Exception as e:
@@ -13,7 +13,7 @@ import tracemalloc
 from collections.abc import Callable
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import psutil
@@ -91,7 +91,7 @@ class JobExecutor:
         self.handler = handler
         self.limits = limits
         self.context = context
-        self._start_time: datetime | None = None
+        self._start_time: float | None = None
         self._memory_peak_mb: int = 0
 
     async def execute(self) -> ExecutionResult:
@@ -105,7 +105,7 @@ class JobExecutor:
         Returns:
             ExecutionResult with status, output, and metrics
         """
-        self._start_time = datetime.now(UTC)
+        self._start_time = perf_counter()
         self._memory_peak_mb = 0
 
         # Start memory tracking
@@ -213,5 +213,4 @@ class JobExecutor:
         """Calculate execution duration in milliseconds."""
         if self._start_time is None:
             return 0
-        elapsed = datetime.now(UTC) - self._start_time
-        return int(elapsed.total_seconds() * 1000)
+        return int((perf_counter() - self._start_time) * 1000)
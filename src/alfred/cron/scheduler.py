@@ -362,19 +362,21 @@ class CronScheduler:
 
     async def _monitor_loop(self) -> None:
         """Background loop that checks job schedules."""
-        while not self._shutdown_event.is_set():
-            try:
-                await self._check_jobs()
-            except Exception:
-                logger.exception("Error checking jobs")
-
-            with contextlib.suppress(TimeoutError):
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=self._check_interval,
-                )
+        # One long-lived waiter: asyncio.wait() returns on timeout without
+        # wrapping a new task or raising TimeoutError on every tick.
+        shutdown = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                try:
+                    self._check_jobs()
+                except Exception:
+                    logger.exception("Error checking jobs")
+
+                await asyncio.wait({shutdown}, timeout=self._check_interval)
+        finally:
+            shutdown.cancel()
 
-    async def _check_jobs(self) -> None:
+    def _check_jobs(self) -> None:
         """Check all jobs and execute any that are due."""
         now = datetime.now(UTC)
 
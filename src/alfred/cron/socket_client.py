@@ -6,10 +6,13 @@ The cron runner uses this client to communicate with the TUI's socket server.
 import asyncio
 import contextlib
 import logging
+import uuid
+from collections import deque
 from typing import Literal
 
 from alfred.cron.socket_protocol import (
     SOCKET_NAME,
+    STREAM_LIMIT,
     ApproveJobRequest,
     ApproveJobResponse,
     PingMessage,
@@ -52,8 +55,14 @@ class SocketClient:
         self._reader: asyncio.StreamReader | None = None
         self._connected = False
         self._connect_task: asyncio.Task[None] | None = None
+        self._read_task: asyncio.Task[None] | None = None
         self._running = False
 
+        # In-flight requests, resolved by the reader task as responses arrive.
+        # Requests are matched by request_id; pings (which carry none) are FIFO.
+        self._pending: dict[str, asyncio.Future[SocketMessage]] = {}
+        self._pending_pongs: deque[asyncio.Future[SocketMessage]] = deque()
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to the TUI socket server."""
@@ -85,12 +94,18 @@ class SocketClient:
                 if not self._connected:
                     await self._connect()
 
-                if self._connected:
+                read_task = self._read_task
+                if self._connected and read_task is not None:
                     # Flush any buffered messages
                     await self._flush_buffer()
 
-                    # Wait a bit before next check
-                    await asyncio.sleep(1.0)
+                    # The reader task ends when the connection drops, so wait
+                    # on it rather than waking up every second to poll
+                    await asyncio.wait({read_task})
+
+                    # Back off before reconnecting so a server that accepts
+                    # and immediately closes can't make us spin
+                    await asyncio.sleep(self._retry_interval)
                 else:
                     # Not connected, wait before retry
                     await asyncio.sleep(self._retry_interval)
@@ -109,8 +124,9 @@ class SocketClient:
             return
 
         try:
-            self._reader, self._writer = await asyncio.open_unix_connection(str(self.socket_path))
+            self._reader, self._writer = await asyncio.open_unix_connection(str(self.socket_path), limit=STREAM_LIMIT)
             self._connected = True
+            self._read_task = asyncio.create_task(self._read_loop(self._reader))
             logger.info(f"Connected to TUI socket: {self.socket_path}")
 
         except Exception as e:
@@ -121,6 +137,14 @@ class SocketClient:
         """Disconnect from the socket server."""
         self._connected = False
 
+        read_task = self._read_task
+        self._read_task = None
+        if read_task is not None and read_task is not asyncio.current_task():
+            read_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await read_task
+        self._fail_pending(ConnectionError("Socket disconnected"))
+
         if self._writer:
             try:
                 self._writer.close()
@@ -130,6 +154,79 @@ class SocketClient:
             self._writer = None
             self._reader = None
 
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        """Route incoming lines to the requests waiting on them.
+
+        A single reader owns the stream so several requests can be in flight
+        at once; unsolicited broadcasts are skipped instead of being mistaken
+        for a response.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    message = SocketMessage.from_json(line)
+                except Exception as e:
+                    logger.debug(f"Ignoring unparseable socket message: {e}")
+                    continue
+
+                future: asyncio.Future[SocketMessage] | None
+                if isinstance(message, PongMessage):
+                    future = self._pending_pongs.popleft() if self._pending_pongs else None
+                else:
+                    future = self._pending.pop(getattr(message, "request_id", ""), None)
+
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Socket read loop error: {e}")
+
+        # Connection closed by the server
+        if self._read_task is asyncio.current_task():
+            await self._disconnect()
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error."""
+        futures = [*self._pending.values(), *self._pending_pongs]
+        self._pending.clear()
+        self._pending_pongs.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _request(self, request: SocketMessage, timeout: float) -> SocketMessage:
+        """Send a request and wait for its matching response.
+
+        Raises:
+            ConnectionError: If not connected or the connection drops
+            TimeoutError: If no response arrives within timeout
+        """
+        if not self._connected or not self._writer:
+            raise ConnectionError("Socket not connected")
+
+        future: asyncio.Future[SocketMessage] = asyncio.get_running_loop().create_future()
+        request_id = getattr(request, "request_id", None)
+        if request_id:
+            self._pending[request_id] = future
+        else:
+            self._pending_pongs.append(future)
+
+        try:
+            self._writer.write(request.to_json().encode("utf-8"))
+            await self._writer.drain()
+            async with asyncio.timeout(timeout):
+                return await future
+        finally:
+            if request_id:
+                self._pending.pop(request_id, None)
+            elif future in self._pending_pongs:
+                self._pending_pongs.remove(future)
+
     async def _flush_buffer(self) -> None:
         """Send all buffered messages."""
         if not self._connected or not self._writer:
@@ -185,23 +282,12 @@ class SocketClient:
         Returns:
             True if TUI responded with pong
         """
-        if not self._connected or not self._writer or not self._reader:
+        if not self._connected or not self._writer:
             return False
 
         try:
-            # Send ping
-            ping = PingMessage()
-            self._writer.write(ping.to_json().encode("utf-8"))
-            await self._writer.drain()
-
-            # Wait for pong
-            async with asyncio.timeout(timeout):
-                line = await self._reader.readline()
-                if not line:
-                    return False
-
-                response = SocketMessage.from_json(line.decode("utf-8").strip())
-                return isinstance(response, PongMessage)
+            response = await self._request(PingMessage(), timeout)
+            return isinstance(response, PongMessage)
 
         except Exception as e:
             logger.debug(f"Ping failed: {e}")
@@ -216,30 +302,16 @@ class SocketClient:
         Returns:
             QueryJobsResponse with current job status, or None if failed
         """
-        if not self._connected or not self._writer or not self._reader:
+        if not self._connected or not self._writer:
             logger.debug("Cannot query jobs: not connected")
             return None
 
         try:
-            import uuid
-
-            request_id = str(uuid.uuid4())
-            request = QueryJobsRequest(request_id=request_id)
-
-            # Send query
-            self._writer.write(request.to_json().encode("utf-8"))
-            await self._writer.drain()
-
-            # Wait for response
-            async with asyncio.timeout(timeout):
-                line = await self._reader.readline()
-                if not line:
-                    return None
-
-                response = SocketMessage.from_json(line.decode("utf-8").strip())
-                if isinstance(response, QueryJobsResponse):
-                    return response
-                return None
+            request = QueryJobsRequest(request_id=str(uuid.uuid4()))
+            response = await self._request(request, timeout)
+            if isinstance(response, QueryJobsResponse):
+                return response
+            return None
 
         except Exception as e:
             logger.debug(f"Query jobs failed: {e}")
@@ -257,30 +329,16 @@ class SocketClient:
         Returns:
             SubmitJobResponse with result, or None if failed
         """
-        if not self._connected or not self._writer or not self._reader:
+        if not self._connected or not self._writer:
             logger.debug("Cannot submit job: not connected")
             return None
 
         try:
-            import uuid
-
-            request_id = str(uuid.uuid4())
-            request = SubmitJobRequest(request_id=request_id, name=name, expression=expression, code=code)
-
-            # Send request
-            self._writer.write(request.to_json().encode("utf-8"))
-            await self._writer.drain()
-
-            # Wait for response
-            async with asyncio.timeout(timeout):
-                line = await self._reader.readline()
-                if not line:
-                    return None
-
-                response = SocketMessage.from_json(line.decode("utf-8").strip())
-                if isinstance(response, SubmitJobResponse):
-                    return response
-                return None
+            request = SubmitJobRequest(request_id=str(uuid.uuid4()), name=name, expression=expression, code=code)
+            response = await self._request(request, timeout)
+            if isinstance(response, SubmitJobResponse):
+                return response
+            return None
 
         except Exception as e:
             logger.debug(f"Submit job failed: {e}")
@@ -296,30 +354,16 @@ class SocketClient:
         Returns:
             ApproveJobResponse with result, or None if failed
         """
-        if not self._connected or not self._writer or not self._reader:
+        if not self._connected or not self._writer:
             logger.debug("Cannot approve job: not connected")
             return None
 
         try:
-            import uuid
-
-            request_id = str(uuid.uuid4())
-            request = ApproveJobRequest(request_id=request_id, job_identifier=job_identifier)
-
-            # Send request
-            self._writer.write(request.to_json().encode("utf-8"))
-            await self._writer.drain()
-
-            # Wait for response
-            async with asyncio.timeout(timeout):
-                line = await self._reader.readline()
-                if not line:
-                    return None
-
-                response = SocketMessage.from_json(line.decode("utf-8").strip())
-                if isinstance(response, ApproveJobResponse):
-                    return response
-                return None
+            request = ApproveJobRequest(request_id=str(uuid.uuid4()), job_identifier=job_identifier)
+            response = await self._request(request, timeout)
+            if isinstance(response, ApproveJobResponse):
+                return response
+            return None
 
         except Exception as e:
             logger.debug(f"Approve job failed: {e}")
@@ -335,30 +379,16 @@ class SocketClient:
         Returns:
             RejectJobResponse with result, or None if failed
         """
-        if not self._connected or not self._writer or not self._reader:
+        if not self._connected or not self._writer:
             logger.debug("Cannot reject job: not connected")
             return None
 
         try:
-            import uuid
-
-            request_id = str(uuid.uuid4())
-            request = RejectJobRequest(request_id=request_id, job_identifier=job_identifier)
-
-            # Send request
-            self._writer.write(request.to_json().encode("utf-8"))
-            await self._writer.drain()
-
-            # Wait for response
-            async with asyncio.timeout(timeout):
-                line = await self._reader.readline()
-                if not line:
-                    return None
-
-                response = SocketMessage.from_json(line.decode("utf-8").strip())
-                if isinstance(response, RejectJobResponse):
-                    return response
-                return None
+            request = RejectJobRequest(request_id=str(uuid.uuid4()), job_identifier=job_identifier)
+            response = await self._request(request, timeout)
+            if isinstance(response, RejectJobResponse):
+                return response
+            return None
 
         except Exception as e:
             logger.debug(f"Reject job failed: {e}")
@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 # Socket path (XDG cache directory)
 SOCKET_NAME = "notify.sock"
 
+# StreamReader buffer limit for socket connections. Messages are one JSON line
+# each, and a submit_job request carrying a large job's code easily outgrows
+# asyncio's 64 KiB default, which fails readline() and drops the connection.
+STREAM_LIMIT = 1024 * 1024
+
 
 class MessageType(StrEnum):
     """Types of messages sent over the socket."""
@@ -66,8 +71,8 @@ class SocketMessage:
         return json.dumps(data) + "\n"
 
     @classmethod
-    def from_json(cls, data: str) -> "SocketMessage":
-        """Deserialize message from JSON string."""
+    def from_json(cls, data: str | bytes) -> "SocketMessage":
+        """Deserialize message from a JSON string or raw UTF-8 line."""
         obj = json.loads(data)
         obj["type"] = MessageType(obj["type"])
         obj["timestamp"] = datetime.fromisoformat(obj["timestamp"])
@@ -14,6 +14,7 @@ from typing import Any, TypeVar
 
 from alfred.cron.socket_protocol import (
     SOCKET_NAME,
+    STREAM_LIMIT,
     ApproveJobRequest,
     ApproveJobResponse,
     JobCompletedMessage,
@@ -76,6 +77,7 @@ class SocketServer:
         self.socket_path = get_cache_dir() / SOCKET_NAME
         self._server: asyncio.Server | None = None
         self._running = False
+        self._clients: set[asyncio.StreamWriter] = set()
 
         # Callbacks
         self._on_notify: Callable[[NotifyMessage], None] | None = on_notify
@@ -111,6 +113,7 @@ class SocketServer:
         self._server = await asyncio.start_unix_server(
             self._handle_client,
             path=str(self.socket_path),
+            limit=STREAM_LIMIT,
         )
 
         # Set socket permissions (allow only owner to read/write)
@@ -123,6 +126,13 @@ class SocketServer:
         """Stop the socket server and clean up."""
         self._running = False
 
+        # Close client connections first; Server.wait_closed() waits for them
+        writers = list(self._clients)
+        self._clients.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
         if self._server:
             self._server.close()
             await self._server.wait_closed()
@@ -142,6 +152,7 @@ class SocketServer:
         """
         peer = writer.get_extra_info("peername") or "unknown"
         logger.debug(f"Client connected: {peer}")
+        self._clients.add(writer)
 
         try:
             while self._running:
@@ -152,12 +163,11 @@ class SocketServer:
                     break
 
                 try:
-                    # Decode and parse the message
-                    data = line.decode("utf-8").strip()
-                    if not data:
+                    # Parse the raw line; json.loads decodes UTF-8 bytes itself
+                    if line.isspace():
                         continue
 
-                    message = SocketMessage.from_json(data)
+                    message = SocketMessage.from_json(line)
                     await self._dispatch_message(message, writer)
 
                 except Exception as e:
@@ -169,6 +179,7 @@ class SocketServer:
         except Exception as e:
             logger.error(f"Error handling client: {e}")
         finally:
+            self._clients.discard(writer)
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
@@ -4,10 +4,13 @@ Handles saving/loading jobs from JSONL files with atomic writes.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import aiofiles
 
@@ -16,6 +19,11 @@ from alfred.data_manager import get_data_dir
 
 logger = logging.getLogger(__name__)
 
+# Files and writes below this size are handled inline. aiofiles hops to a worker
+# thread for every open/read/write/close, which costs far more than the actual
+# I/O on a few-KB, page-cached cron file.
+INLINE_IO_THRESHOLD = 64 * 1024
+
 
 class CronStore:
     """Persistent storage for cron jobs and execution history.
@@ -42,6 +50,11 @@ class CronStore:
         # Lock for serializing file operations
         self._lock = asyncio.Lock()
 
+        # Parsed job records keyed by the (mtime_ns, size) of cron.jsonl they
+        # were read from. A stat is far cheaper than re-reading and decoding
+        # every line, and the scheduler loads jobs on every tick.
+        self._jobs_cache: tuple[tuple[int, int], list[dict[str, Any]]] | None = None
+
     async def save_job(self, job: Job) -> None:
         """Save job to cron.jsonl.
 
@@ -87,10 +100,19 @@ class CronStore:
 
     async def _load_jobs_unlocked(self) -> list[Job]:
         """Load jobs without lock (caller must hold lock)."""
-        if not self.jobs_path.exists():
+        try:
+            st = self.jobs_path.stat()
+        except FileNotFoundError:
+            self._jobs_cache = None
             return []
 
+        key = (st.st_mtime_ns, st.st_size)
+        if self._jobs_cache is not None and self._jobs_cache[0] == key:
+            # Fresh Job objects each time: callers mutate what they load
+            return [Job.from_dict(data) for data in self._jobs_cache[1]]
+
         jobs = []
+        records = []
         content = await self._read_file_async(self.jobs_path)
 
         for line_num, line in enumerate(content.strip().split("\n"), 1):
@@ -100,9 +122,11 @@ class CronStore:
             try:
                 data = json.loads(line)
                 jobs.append(Job.from_dict(data))
+                records.append(data)
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(f"Skipping corrupt line {line_num} in {self.jobs_path}: {e}")
 
+        self._jobs_cache = (key, records)
         return jobs
 
     async def record_execution(self, record: ExecutionRecord) -> None:
@@ -129,30 +153,46 @@ class CronStore:
         Returns:
             List of execution records (newest first)
         """
-        if not self.history_path.exists():
+        try:
+            size = self.history_path.stat().st_size
+        except FileNotFoundError:
             return []
 
-        records = []
-        content = await self._read_file_async(self.history_path)
+        # The history file is append-only and grows without bound, so scan
+        # large ones off the event loop
+        if size < INLINE_IO_THRESHOLD:
+            return self._select_job_history(job_id, limit)
+        return await asyncio.to_thread(self._select_job_history, job_id, limit)
 
-        for line in content.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                if data.get("job_id") == job_id:
-                    records.append(ExecutionRecord.from_dict(data))
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Skipping corrupt history line: {e}")
+    def _select_job_history(self, job_id: str, limit: int | None) -> list[ExecutionRecord]:
+        """Return a job's records newest first, keeping at most ``limit`` while scanning."""
 
-        # Sort by started_at descending (newest first)
-        records.sort(key=lambda r: r.started_at, reverse=True)
+        def started_at(record: ExecutionRecord) -> datetime:
+            return record.started_at
 
+        records = self._iter_job_history(job_id)
         if limit:
-            records = records[:limit]
-
-        return records
+            return heapq.nlargest(limit, records, key=started_at)
+        return sorted(records, key=started_at, reverse=True)
+
+    def _iter_job_history(self, job_id: str) -> Iterator[ExecutionRecord]:
+        """Stream history lines, decoding only those that mention ``job_id``."""
+        # record_execution writes job_id with json.dumps, so its encoded form
+        # is a cheap necessary condition for a match
+        needle = json.dumps(job_id)
+        try:
+            with self.history_path.open() as f:
+                for line in f:
+                    if needle not in line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                        if data.get("job_id") == job_id:
+                            yield ExecutionRecord.from_dict(data)
+                    except (json.JSONDecodeError, KeyError) as e:
+                        logger.warning(f"Skipping corrupt history line: {e}")
+        except FileNotFoundError:
+            return
 
     async def _write_jobs_atomic(self, jobs: list[Job]) -> None:
         """Write jobs to file atomically using temp file + rename.
@@ -160,15 +200,22 @@ class CronStore:
         Args:
             jobs: List of jobs to write
         """
-        lines = [json.dumps(job.to_dict()) + "\n" for job in jobs]
+        records = [job.to_dict() for job in jobs]
+        content = "".join(json.dumps(data) + "\n" for data in records)
         temp_path = self.jobs_path.with_suffix(".tmp")
 
-        # Write to temp file
-        async with aiofiles.open(temp_path, "w") as f:
-            await f.writelines(lines)
+        # Write to temp file in one call rather than one per line
+        if len(content) < INLINE_IO_THRESHOLD:
+            temp_path.write_text(content)
+        else:
+            async with aiofiles.open(temp_path, "w") as f:
+                await f.write(content)
+
+        # Atomic rename (replace also overwrites an existing file on Windows)
+        temp_path.replace(self.jobs_path)
 
-        # Atomic rename
-        temp_path.rename(self.jobs_path)
+        st = self.jobs_path.stat()
+        self._jobs_cache = ((st.st_mtime_ns, st.st_size), records)
 
     async def _read_file_async(self, path: Path) -> str:
         """Read entire file asynchronously.
@@ -179,8 +226,12 @@ class CronStore:
         Returns:
             File contents as string
         """
-        if not path.exists():
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             return ""
+        if size < INLINE_IO_THRESHOLD:
+            return path.read_text()
         async with aiofiles.open(path) as f:
             return await f.read()
 
@@ -191,5 +242,9 @@ class CronStore:
             path: File path to append to
             content: Content to append
         """
+        if len(content) < INLINE_IO_THRESHOLD:
+            with path.open("a") as f:
+                f.write(content)
+            return
         async with aiofiles.open(path, "a") as f:
             await f.write(content)
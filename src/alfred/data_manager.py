@@ -125,11 +125,15 @@ def init_xdg_directories() -> None:
     # Copy templates as data files to workspace
     # These become the user's editable context files (SOUL.md, USER.md, etc.)
     if BUNDLED_TEMPLATES.exists():
-        for template_file in BUNDLED_TEMPLATES.glob("*.md"):
+        # One directory read per side instead of a Path and stat() per template
+        existing = set(os.listdir(workspace_dir))
+        with os.scandir(BUNDLED_TEMPLATES) as entries:
+            template_files = [entry for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+        for template_file in template_files:
             target_path = workspace_dir / template_file.name
-            if not target_path.exists():
+            if template_file.name not in existing:
                 try:
-                    shutil.copy2(template_file, target_path)
+                    shutil.copy2(template_file.path, target_path)
                     logger.info(f"Created workspace file: {target_path}")
                 except Exception as e:
                     logger.warning(f"Failed to copy {template_file.name}: {e}")
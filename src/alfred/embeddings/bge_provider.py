@@ -80,7 +80,7 @@ async def _load_model_async(model_name: str = "bge-base") -> Any:
         logger.info(f"Loading embedding model: {model_id}")
 
         # Run synchronous model loading in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         _model_instance = await loop.run_in_executor(None, lambda: SentenceTransformer(model_id))
         _model_name = model_name
 
@@ -218,14 +218,14 @@ class BGEProvider(EmbeddingProvider):
         start = time.perf_counter()
         try:
             # Run in thread pool since SentenceTransformer is synchronous
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             embedding = await loop.run_in_executor(
                 None,
                 self._embed_sync,
                 text,
             )
             elapsed_ms = (time.perf_counter() - start) * 1000
-            logger.log(TRACE, f"[EMBED] text_len={len(text)} dim={self.dimension} time={elapsed_ms:.2f}ms")
+            logger.log(TRACE, "[EMBED] text_len=%d dim=%d time=%.2fms", len(text), self.dimension, elapsed_ms)
             return embedding
         finally:
             async with self._in_flight_lock:
@@ -257,22 +257,25 @@ class BGEProvider(EmbeddingProvider):
                 self._in_flight.add(dt)
 
         start = time.perf_counter()
-        total_chars = sum(len(t) for t in texts)
         try:
             # Run in thread pool since SentenceTransformer is synchronous
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             embeddings = await loop.run_in_executor(
                 None,
                 self._embed_batch_sync,
                 texts,
             )
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            avg_per_item = elapsed_ms / len(texts) if texts else 0
-            logger.log(
-                TRACE,
-                f"[EMBED_BATCH] count={len(texts)} total_chars={total_chars} "
-                f"dim={self.dimension} time={elapsed_ms:.2f}ms avg_per_item={avg_per_item:.2f}ms",
-            )
+            if logger.isEnabledFor(TRACE):
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logger.log(
+                    TRACE,
+                    "[EMBED_BATCH] count=%d total_chars=%d dim=%d time=%.2fms avg_per_item=%.2fms",
+                    len(texts),
+                    sum(len(t) for t in texts),
+                    self.dimension,
+                    elapsed_ms,
+                    elapsed_ms / len(texts),
+                )
             return embeddings
         finally:
             async with self._in_flight_lock:
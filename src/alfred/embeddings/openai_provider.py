@@ -104,6 +104,9 @@ class OpenAIProvider(EmbeddingProvider):
         self._model = config.embedding_model
         self._max_retries = max_retries
         self._base_delay = base_delay
+        # Requests in flight keyed by text, so concurrent callers embedding the
+        # same text (e.g. a turn's query and its persisted message) share one call
+        self._pending: dict[str, asyncio.Task[list[float]]] = {}
 
     @property
     def dimension(self) -> int:
@@ -113,12 +116,24 @@ class OpenAIProvider(EmbeddingProvider):
     async def embed(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
+        Concurrent calls for the same text share a single API request.
+
         Args:
             text: Input text to embed
 
         Returns:
             List of floats representing the embedding vector
         """
+        task = self._pending.get(text)
+        if task is None:
+            task = asyncio.create_task(self._embed_single(text))
+            self._pending[text] = task
+            task.add_done_callback(lambda _: self._pending.pop(text, None))
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _embed_single(self, text: str) -> list[float]:
+        """Request the embedding for one text from the API."""
         start = time.perf_counter()
 
         async def _embed() -> list[float]:
@@ -136,7 +151,7 @@ class OpenAIProvider(EmbeddingProvider):
             base_delay=self._base_delay,
         )
         elapsed_ms = (time.perf_counter() - start) * 1000
-        logger.log(TRACE, f"[EMBED] text_len={len(text)} dim={self.dimension} time={elapsed_ms:.2f}ms")
+        logger.log(TRACE, "[EMBED] text_len=%d dim=%d time=%.2fms", len(text), self.dimension, elapsed_ms)
         return result
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -152,7 +167,6 @@ class OpenAIProvider(EmbeddingProvider):
             return []
 
         start = time.perf_counter()
-        total_chars = sum(len(t) for t in texts)
 
         async def _embed_batch() -> list[list[float]]:
             response = await self._client.embeddings.create(
@@ -168,11 +182,15 @@ class OpenAIProvider(EmbeddingProvider):
             max_retries=self._max_retries,
             base_delay=self._base_delay,
         )
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        avg_per_item = elapsed_ms / len(texts) if texts else 0
-        logger.log(
-            TRACE,
-            f"[EMBED_BATCH] count={len(texts)} total_chars={total_chars} "
-            f"dim={self.dimension} time={elapsed_ms:.2f}ms avg_per_item={avg_per_item:.2f}ms",
-        )
+        if logger.isEnabledFor(TRACE):
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.log(
+                TRACE,
+                "[EMBED_BATCH] count=%d total_chars=%d dim=%d time=%.2fms avg_per_item=%.2fms",
+                len(texts),
+                sum(len(t) for t in texts),
+                self.dimension,
+                elapsed_ms,
+                elapsed_ms / len(texts),
+            )
         return result
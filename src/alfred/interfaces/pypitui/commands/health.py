@@ -87,9 +87,9 @@ class HealthCommand(Command):
                 else:
                     lines.append(_status_ok("Current Session: No active session"))
 
-                # Count total sessions
-                all_sessions = session_manager.list_sessions()
-                lines.append(f"  Total Sessions: {len(all_sessions)}")
+                # Count total sessions without loading their transcripts
+                session_count = await session_manager.store.count_sessions()
+                lines.append(f"  Total Sessions: {session_count}")
             except Exception as e:
                 lines.append(_status_error(f"Session system error: {e}"))
 
@@ -1,5 +1,6 @@
 """Telegram bot interface for Alfred with streaming support."""
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -21,6 +22,13 @@ from alfred.data_manager import get_data_dir
 logger = logging.getLogger(__name__)
 
 
+def _display_text(response: str) -> str:
+    """Truncate a response to fit in a single Telegram message."""
+    if len(response) > 4000:
+        return response[:4000] + "\n[Response too long, truncated...]"
+    return response
+
+
 class TelegramInterface:
     """Telegram interface with streaming support.
 
@@ -36,11 +44,12 @@ class TelegramInterface:
         self._data_dir = data_dir or get_data_dir()
         self._state_file = self._data_dir / "telegram_state.json"
         self._chat_id: int | None = None
+        self._state_loaded = False
 
     @property
     def chat_id(self) -> int | None:
         """Get current chat_id, loading from file if needed."""
-        if self._chat_id is None:
+        if not self._state_loaded:
             self._load_state()
         return self._chat_id
 
@@ -48,19 +57,21 @@ class TelegramInterface:
         """Track chat_id from incoming message and persist."""
         if update.effective_chat:
             new_chat_id = update.effective_chat.id
-            if new_chat_id != self._chat_id:
+            if new_chat_id != self.chat_id:
                 self._chat_id = new_chat_id
                 self._save_state()
 
     def _load_state(self) -> None:
-        """Load state from file."""
-        if self._state_file.exists():
-            try:
-                with open(self._state_file) as f:
-                    data = json.load(f)
-                    self._chat_id = data.get("chat_id")
-            except Exception as e:
-                logger.warning(f"Failed to load telegram state: {e}")
+        """Load state from file once; later reads use the in-memory copy."""
+        self._state_loaded = True
+        try:
+            data = json.loads(self._state_file.read_bytes())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Failed to load telegram state: {e}")
+            return
+        self._chat_id = data.get("chat_id")
 
     def _save_state(self) -> None:
         """Save state to file immediately."""
@@ -122,30 +133,34 @@ class TelegramInterface:
         full_response = ""
         last_update_len = 0
         update_threshold = 50  # Update every 50 chars
+        # At most one edit in flight, so the stream keeps flowing while
+        # Telegram answers instead of stalling on every round-trip
+        pending_edit: asyncio.Task[Any] | None = None
 
         try:
             async for chunk in self.alfred.chat_stream(update.message.text, session_id=chat_id):
                 full_response += chunk
 
-                # Update message periodically
-                if len(full_response) - last_update_len >= update_threshold:
-                    # Truncate if too long for Telegram
-                    display_text = full_response[:4000]
-                    if len(full_response) > 4000:
-                        display_text += "\n[Response too long, truncated...]"
+                if pending_edit is not None and pending_edit.done():
+                    pending_edit.result()  # Surface edit failures
+                    pending_edit = None
 
-                    await response_message.edit_text(display_text)
+                # Update message periodically
+                if pending_edit is None and len(full_response) - last_update_len >= update_threshold:
+                    pending_edit = asyncio.create_task(response_message.edit_text(_display_text(full_response)))
                     last_update_len = len(full_response)
 
-            # Final update
-            display_text = full_response[:4000]
-            if len(full_response) > 4000:
-                display_text += "\n[Response too long, truncated...]"
+            if pending_edit is not None:
+                await pending_edit
 
+            # Final update
+            display_text = _display_text(full_response)
             if display_text != "Thinking...":
                 await response_message.edit_text(display_text)
 
         except Exception as e:
+            if pending_edit is not None:
+                pending_edit.cancel()
             logger.exception("Error handling message")
             await response_message.edit_text(f"Error: {e}")
 
@@ -166,8 +181,6 @@ class TelegramInterface:
         logger.info("Bot started. Press Ctrl+C to stop.")
 
         # Keep running until interrupted
-        import asyncio
-
         stop_event = asyncio.Event()
         try:
             await stop_event.wait()
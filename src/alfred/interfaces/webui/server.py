@@ -30,6 +30,7 @@ from alfred.support_reflection import (
     ResetProfileValueAction,
     ScopeLimitProfileValueAction,
 )
+from alfred.utils.async_helpers import install_default_executor
 
 logger = logging.getLogger(__name__)
 
@@ -549,22 +550,21 @@ def _get_bootstrap_startup_error(app_state: object | None) -> str | None:
 _active_connections: set[WebSocket] = set()
 
 
-async def _register_connection(websocket: WebSocket) -> None:
+def _register_connection(websocket: WebSocket) -> None:
     """Register an active WebSocket connection."""
     _active_connections.add(websocket)
 
 
-async def _unregister_connection(websocket: WebSocket) -> None:
+def _unregister_connection(websocket: WebSocket) -> None:
     """Unregister a WebSocket connection."""
     _active_connections.discard(websocket)
 
 
 async def _close_all_connections() -> None:
     """Close all active WebSocket connections."""
-    for ws in list(_active_connections):
-        with suppress(Exception):
-            await ws.close()
-        _active_connections.discard(ws)
+    connections = list(_active_connections)
+    _active_connections.clear()
+    await asyncio.gather(*(ws.close() for ws in connections), return_exceptions=True)
 
 
 def _serialize_tool_call(tool_call: object) -> dict[str, object]:
@@ -1517,7 +1517,7 @@ async def _handle_sessions_command(
         current_session_id = _session_identifier(current_session) if current_session is not None else None
 
         session_list = []
-        for session in list(sessions)[:20]:
+        for session in sessions[:20]:
             meta = getattr(session, "meta", None)
             created_at = getattr(session, "created_at", getattr(meta, "created_at", datetime.now(UTC)))
             last_active = getattr(session, "last_active", getattr(meta, "last_active", created_at))
@@ -1922,11 +1922,12 @@ def _render_webui_config_script(debug: bool) -> str:
     return f"window.__ALFRED_WEBUI_CONFIG__ = {json.dumps({'debug': debug})};"
 
 
-def create_app(alfred_instance: WebUIAlfred | None = None, debug: bool = False) -> FastAPI:
+def create_app(alfred_instance: WebUIAlfred | None = None, debug: bool = False, io_thread_pool_size: int | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
         alfred_instance: Optional Alfred instance for chat integration
+        io_thread_pool_size: Size of the serving loop's default executor; None keeps the stdlib default
 
     Returns:
         Configured FastAPI application instance.
@@ -2022,7 +2023,7 @@ def create_app(alfred_instance: WebUIAlfred | None = None, debug: bool = False)
     async def websocket_endpoint(websocket: WebSocket) -> None:
         """WebSocket endpoint for real-time communication."""
         await websocket.accept()
-        await _register_connection(websocket)
+        _register_connection(websocket)
 
         alfred_instance: WebUIAlfred | None = websocket.app.state.alfred
         connection_debug_stats = _WebSocketDebugStats(
@@ -2442,7 +2443,13 @@ def create_app(alfred_instance: WebUIAlfred | None = None, debug: bool = False)
                     "webui.websocket.closed",
                     summary=connection_debug_stats.summary(),
                 )
-            await _unregister_connection(websocket)
+            _unregister_connection(websocket)
+
+    @app.on_event("startup")
+    async def startup_event() -> None:
+        """Size the serving loop's default executor once Uvicorn has created it."""
+        if io_thread_pool_size is not None:
+            install_default_executor(io_thread_pool_size)
 
     @app.on_event("shutdown")
     async def shutdown_event() -> None:
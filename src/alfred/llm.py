@@ -21,6 +21,19 @@ _AsyncFunc = Callable[P, Coroutine[Any, Any, T]]
 
 logger = logging.getLogger(__name__)
 
+# Encoding used to count streamed completion tokens
+_TOKEN_ENCODING = "cl100k_base"
+
+
+async def preload_token_encoder() -> None:
+    """Load the token encoding in a worker thread.
+
+    tiktoken reads (and on first use downloads) the BPE ranks inside
+    get_encoding(), which would otherwise block the event loop during the
+    first streamed turn. Later calls hit tiktoken's in-process cache.
+    """
+    await asyncio.to_thread(tiktoken.get_encoding, _TOKEN_ENCODING)
+
 
 def _sanitize_content(text: str) -> str:
     """Sanitize content from LLM to remove invalid UTF-8 surrogates.
@@ -34,7 +47,7 @@ def _sanitize_content(text: str) -> str:
     return text.encode("utf-8", errors="surrogatepass").decode("utf-8", errors="replace")
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     role: str  # "system", "user", "assistant", "tool"
     content: str
@@ -43,7 +56,7 @@ class ChatMessage:
     reasoning_content: str | None = None  # For Kimi thinking mode
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     content: str
     model: str
@@ -695,7 +708,7 @@ class KimiProvider(LLMProvider):
             "full_content": "",
             "full_reasoning": "",
         }
-        encoder = tiktoken.get_encoding("cl100k_base")
+        encoder = tiktoken.get_encoding(_TOKEN_ENCODING)
         streamed_chunks = 0
 
         try:
@@ -72,3 +72,11 @@ class MemoryStore:
             List of all MemoryEntry objects in the store.
         """
         raise NotImplementedError
+
+    async def count_entries(self) -> int:
+        """Count memory entries.
+
+        Returns:
+            Number of MemoryEntry objects in the store.
+        """
+        raise NotImplementedError
@@ -253,6 +253,15 @@ class SQLiteMemoryStore(MemoryStore):
             for row in results
         ]
 
+    async def count_entries(self) -> int:
+        """Count memory entries without loading them.
+
+        Returns:
+            Number of entries
+        """
+        await self._ensure_store_ready()
+        return await self._store.count_memories()
+
     async def delete_by_id(self, entry_id: str) -> tuple[bool, str]:
         """Delete memory by ID.
 
@@ -357,15 +366,13 @@ class SQLiteMemoryStore(MemoryStore):
             return 0, "No memories to delete"
 
         # Use simple text search.
-        to_delete = [entry for entry in entries if query.lower() in entry.content.lower()]
+        needle = query.lower()
+        to_delete = [entry.entry_id for entry in entries if needle in entry.content.lower()]
 
         if not to_delete:
             return 0, f"No memories matching query: {query}"
 
-        deleted_count = 0
-        for entry in to_delete:
-            if await self._store.delete_memory(entry.entry_id):
-                deleted_count += 1
+        deleted_count = await self._store.delete_memories(to_delete)
 
         return deleted_count, f"Deleted {deleted_count} memories"
 
@@ -391,6 +398,4 @@ class SQLiteMemoryStore(MemoryStore):
 
     async def _get_memory_count(self) -> int:
         """Get memory count asynchronously."""
-        await self._ensure_store_ready()
-        entries = await self._store.get_all_memories()
-        return len(entries)
+        return await self.count_entries()
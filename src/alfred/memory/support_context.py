@@ -232,11 +232,7 @@ async def get_fresh_global_situation(
 
     active_domains = await store.list_active_life_domains(limit=4)
     candidate_arcs = await store.list_resume_arcs(limit=5)
-    top_arc_snapshots: list[ArcSnapshot] = []
-    for arc in candidate_arcs:
-        snapshot = await store.get_arc_snapshot(arc.arc_id)
-        if snapshot is not None:
-            top_arc_snapshots.append(snapshot)
+    top_arc_snapshots = await store.get_arc_snapshots([arc.arc_id for arc in candidate_arcs])
 
     refreshed = derive_global_situation(
         active_domains,
@@ -305,11 +301,8 @@ async def get_session_start_orientation_context(
         now=now,
         staleness_seconds=staleness_seconds,
     )
-    top_arc_snapshots: list[ArcSnapshot] = []
-    for arc in await store.list_resume_arcs(limit=3):
-        snapshot = await store.get_arc_snapshot(arc.arc_id)
-        if snapshot is not None:
-            top_arc_snapshots.append(snapshot)
+    resume_arcs = await store.list_resume_arcs(limit=3)
+    top_arc_snapshots = await store.get_arc_snapshots([arc.arc_id for arc in resume_arcs])
 
     return OrientationContext(
         global_situation=global_situation,
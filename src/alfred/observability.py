@@ -9,12 +9,17 @@ This module keeps the logging-surface contract in one place:
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import TextIO
 
@@ -126,13 +131,15 @@ class SurfaceFormatter(logging.Formatter):
             else "%(asctime)s %(levelname)s surface=%(surface)s logger=%(name)s %(message)s"
         )
         super().__init__(fmt=fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        # Probe the stream once; NO_COLOR (https://no-color.org) opts out of ANSI prefixes
+        self._color = kind == "console" and "NO_COLOR" not in os.environ and self._stream_is_tty()
 
     def format(self, record: logging.LogRecord) -> str:
         surface = resolve_surface(record)
         record.surface = surface.value
         record.surface_prefix = render_surface_prefix(
             surface,
-            color=self.kind == "console" and self._stream_is_tty(),
+            color=self._color,
         )
         # Get the full formatted message
         msg = record.getMessage()
@@ -154,6 +161,7 @@ class SurfaceFormatter(logging.Formatter):
         return False
 
 
+@lru_cache(maxsize=512)
 def surface_for_logger_name(logger_name: str) -> Surface:
     """Map a logger name to a stable Alfred surface."""
     for prefix, surface in _SURFACE_PREFIXES:
@@ -175,12 +183,16 @@ def resolve_surface(record: logging.LogRecord) -> Surface:
     return surface_for_logger_name(record.name)
 
 
+# Rendered once: formatters look these up per record instead of rebuilding them
+_PLAIN_PREFIXES: dict[Surface, str] = {surface: f"[{surface.value}]" for surface in Surface}
+_COLOR_PREFIXES: dict[Surface, str] = {
+    surface: f"{ANSI_COLORS[surface]}{prefix}{ANSI_RESET}" for surface, prefix in _PLAIN_PREFIXES.items()
+}
+
+
 def render_surface_prefix(surface: Surface, *, color: bool) -> str:
     """Render a stable surface prefix, optionally colorized for a TTY."""
-    prefix = f"[{surface.value}]"
-    if not color:
-        return prefix
-    return f"{ANSI_COLORS[surface]}{prefix}{ANSI_RESET}"
+    return _COLOR_PREFIXES[surface] if color else _PLAIN_PREFIXES[surface]
 
 
 def _truncate_lists_in_string(text: str, max_elements: int = 6, min_elements_to_truncate: int = 20) -> str:
@@ -301,12 +313,73 @@ def log_event(
     **fields: object,
 ) -> None:
     """Emit a formatted event message at the requested log level."""
+    if not logger.isEnabledFor(level):
+        return
     extra: dict[str, object] = {}
     if surface is not None:
         extra["surface"] = surface.value if isinstance(surface, Surface) else str(surface)
     logger.log(level, event_message(event, **fields), extra=extra or None)
 
 
+# Records buffered per handler before a forced write; the listener also
+# flushes whenever its queue drains, so quiet periods are never delayed.
+_BUFFER_CAPACITY = 256
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes buffered handlers once the queue is empty."""
+
+    def __init__(self, records: queue.SimpleQueue[logging.LogRecord], *handlers: logging.Handler, respect_handler_level: bool) -> None:
+        super().__init__(records, *handlers, respect_handler_level=respect_handler_level)
+        self._records = records
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self._records.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+class _QueuedHandlers(logging.handlers.QueueHandler):
+    """Queue records for a background listener that owns the blocking handlers.
+
+    Console and file writes happen on the listener thread, so logging from the
+    event loop costs a queue put instead of a format, write and flush. Bursts
+    are buffered and written together rather than one write per record.
+    """
+
+    def __init__(self, handlers: list[logging.Handler]) -> None:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        super().__init__(records)
+        self._buffers: list[logging.Handler] = []
+        for handler in handlers:
+            buffer = logging.handlers.MemoryHandler(_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=handler)
+            buffer.setLevel(handler.level)
+            self._buffers.append(buffer)
+        self._handlers = handlers
+        self._listener = _BatchingQueueListener(records, *self._buffers, respect_handler_level=True)
+        self._listener.start()
+        self._stopped = False
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render args now, before the objects they reference can change, but
+        # keep exc_info so the surface formatters still render tracebacks.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self) -> None:
+        if not self._stopped:
+            self._stopped = True
+            # stop() drains queued records; closing a buffer flushes it
+            self._listener.stop()
+            for handler in [*self._buffers, *self._handlers]:
+                with suppress(Exception):
+                    handler.close()
+        super().close()
+
+
 def configure_logging(
     *,
     level: int,
@@ -317,7 +390,9 @@ def configure_logging(
     """Configure Alfred logging with surface-aware console and file handlers."""
     root = logging.getLogger()
     _reset_root_handlers(root)
-    root.setLevel(logging.DEBUG)
+    # Gate at the root too, so records below every handler's threshold are
+    # dropped by isEnabledFor() before their messages are built.
+    root.setLevel(min(level, logging.WARNING) if toast_handler is not None else level)
 
     config = _LoggingConfig(level=level)
 
@@ -327,7 +402,7 @@ def configure_logging(
     console_handler.setLevel(logging.DEBUG)
     console_handler.addFilter(SurfaceRoutingFilter(config))
     console_handler.setFormatter(SurfaceFormatter(kind="console", stream=console_stream))
-    root.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     if log_file is not None:
         log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -336,8 +411,13 @@ def configure_logging(
         file_handler.setLevel(logging.DEBUG)
         file_handler.addFilter(SurfaceRoutingFilter(config))
         file_handler.setFormatter(SurfaceFormatter(kind="file"))
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    queue_handler = _QueuedHandlers(handlers)
+    _mark_owned(queue_handler)
+    root.addHandler(queue_handler)
 
+    # Toasts update TUI state, so they stay on the logging thread
     if toast_handler is not None:
         toast_handler.setLevel(logging.WARNING)
         root.addHandler(toast_handler)
@@ -187,8 +187,9 @@ def build_runtime_self_model(
     # Auto-detect interface from Alfred state
     detected_interface = interface
     if detected_interface is None:
-        # Check if Telegram bot is initialized (not None)
-        detected_interface = InterfaceType.WEBUI if getattr(alfred, "_telegram_bot", None) is not None else InterfaceType.CLI
+        # Telegram mode is recorded up front; the bot client itself is created lazily
+        telegram_mode = getattr(alfred, "_telegram_mode", False) or getattr(alfred, "_telegram_bot", None) is not None
+        detected_interface = InterfaceType.WEBUI if telegram_mode else InterfaceType.CLI
         logger.debug("Auto-detected interface: %s", detected_interface.value)
 
     # Get session ID
@@ -14,6 +14,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -140,6 +141,9 @@ class SessionManager:
         self._embedder = embedder
         self._sessions: dict[str, Session] = {}
         self._cli_session_id: str | None = None
+        # Background persists: one writer task per session drains the latest queued snapshot
+        self._persist_tasks: dict[str, asyncio.Task[None]] = {}
+        self._pending_persists: dict[str, list[Message]] = {}
 
         # Load CLI current session
         self._load_cli_current()
@@ -160,7 +164,10 @@ class SessionManager:
             return
         current_file = self._data_dir / "sessions" / "current.json"
         current_file.parent.mkdir(parents=True, exist_ok=True)
-        current_file.write_text(json.dumps({"session_id": self._cli_session_id}))
+        # Atomic write so a crash mid-save can't leave a truncated current.json
+        temp_file = current_file.with_name(f"{current_file.name}.tmp")
+        temp_file.write_text(json.dumps({"session_id": self._cli_session_id}))
+        temp_file.replace(current_file)
 
     @property
     def store(self) -> SQLiteStore:
@@ -582,18 +589,25 @@ class SessionManager:
         # Only runs when no messages are streaming (completion or non-streaming persist)
         embedding_count = 0
         embedding_time = 0.0
-        if self._embedder is not None:
-            for msg in messages:
-                # Skip if already has embedding or has no content
-                if msg.embedding is not None or not msg.content:
-                    continue
-                embed_start = time.perf_counter()
-                try:
-                    msg.embedding = await self._embedder.embed(msg.content)
-                    embedding_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to generate embedding for message {msg.id}: {e}")
-                embedding_time += time.perf_counter() - embed_start
+        # Skip messages that already have an embedding or have no content
+        to_embed = [msg for msg in messages if msg.embedding is None and msg.content]
+        if self._embedder is not None and to_embed:
+            # One batched request instead of a round trip per message. A lone message
+            # (usually the turn's new user message) goes through embed() so it shares
+            # the provider's in-flight request with the turn's query embedding.
+            embed_start = time.perf_counter()
+            try:
+                if len(to_embed) == 1:
+                    embeddings = [await self._embedder.embed(to_embed[0].content)]
+                else:
+                    embeddings = await self._embedder.embed_batch([msg.content for msg in to_embed])
+            except Exception as e:
+                logger.warning(f"Failed to generate embeddings for {len(to_embed)} messages: {e}")
+            else:
+                for msg, embedding in zip(to_embed, embeddings, strict=True):
+                    msg.embedding = embedding
+                embedding_count = len(to_embed)
+            embedding_time = time.perf_counter() - embed_start
 
         save_start = time.perf_counter()
         await self.store.save_session(session_id, self._serialize_messages(messages), metadata)
@@ -726,38 +740,51 @@ class SessionManager:
         """Get messages from current CLI session."""
         return self.get_session_messages()
 
-    def get_messages_for_context(self, session_id: str | None = None) -> list[tuple[str, str]]:
-        """Get messages formatted for context injection."""
+    def _context_source_messages(self, session_id: str | None = None) -> list[Message]:
+        """Return the live message list backing context reads, without copying it."""
         if session_id:
-            messages = self.get_session_messages(session_id)
-        else:
-            if not self.has_active_session():
-                return []
-            messages = self.get_messages()
+            return self.get_or_create_session(session_id).messages
+        if not self.has_active_session():
+            return []
+        session = self.get_current_cli_session()
+        if session is None:
+            raise RuntimeError("No active session")
+        return session.messages
 
-        result = []
-        for msg in messages[:-1] if messages else []:
-            result.append((msg.role.value, msg.content))
-        return result
+    def get_messages_for_context(self, session_id: str | None = None) -> list[tuple[str, str]]:
+        """Get messages formatted for context injection."""
+        messages = self._context_source_messages(session_id)
+        return [(msg.role.value, msg.content) for msg in islice(messages, max(len(messages) - 1, 0))]
 
     def get_messages_with_tools_for_context(self, session_id: str | None = None) -> list[Message]:
         """Get full messages with tool_calls for context injection."""
-        if session_id:
-            messages = self.get_session_messages(session_id)
-        else:
-            if not self.has_active_session():
-                return []
-            messages = self.get_messages()
-        return list(messages[:-1] if messages else [])
+        return self._context_source_messages(session_id)[:-1]
 
     def _spawn_persist_task(self, session_id: str, messages: list[Message]) -> None:
-        """Spawn background task to persist messages."""
+        """Spawn background task to persist messages.
+
+        Requests made while a persist for the same session is queued or running
+        are coalesced: the writer saves only the latest message list once it is free.
+        """
         try:
             loop = asyncio.get_running_loop()
-            loop.create_task(self._persist_messages(session_id, messages))
         except RuntimeError:
             # No event loop - persist synchronously
             asyncio.run(self._persist_messages(session_id, messages))
+            return
+
+        self._pending_persists[session_id] = messages
+        task = self._persist_tasks.get(session_id)
+        if task is None or task.done():
+            self._persist_tasks[session_id] = loop.create_task(self._drain_pending_persists(session_id))
+
+    async def _drain_pending_persists(self, session_id: str) -> None:
+        """Persist queued message lists for a session until none remain."""
+        try:
+            while (messages := self._pending_persists.pop(session_id, None)) is not None:
+                await self._persist_messages(session_id, messages)
+        finally:
+            self._persist_tasks.pop(session_id, None)
 
     async def _persist_messages(self, session_id: str, messages: list[Message]) -> None:
         """Persist messages to SQLiteStore."""
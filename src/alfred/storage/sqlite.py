@@ -83,6 +83,11 @@ def _sanitize_json_data(data: Any) -> Any:
     return data
 
 
+# Transcript payloads are written on every session save; a shared compact
+# encoder skips per-call JSONEncoder construction and the padding whitespace.
+_encode_payload_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
 _WorkStateEntityType = Literal["arc", "task", "blocker", "open_loop"]
 _WorkStateSignalPolarity = Literal["positive", "negative"]
 
@@ -582,7 +587,7 @@ class SQLiteStore:
         raw_timestamp = message.get("timestamp")
         timestamp = None if raw_timestamp is None else str(raw_timestamp)
 
-        return (message_id, message_idx, role, timestamp, json.dumps(message))
+        return (message_id, message_idx, role, timestamp, _encode_payload_json(message))
 
     @staticmethod
     def _message_embedding_locator(session_id: str, message_id: str) -> str:
@@ -592,16 +597,15 @@ class SQLiteStore:
     async def _replace_session_messages(self, db: Any, session_id: str, messages: list[dict[str, Any]]) -> None:
         """Replace one session's canonical transcript rows."""
         await db.execute("DELETE FROM session_messages WHERE session_id = ?", (session_id,))
-        for fallback_idx, message in enumerate(messages):
-            message_id, message_idx, role, timestamp, payload_json = self._session_message_identity(message, fallback_idx)
-            await db.execute(
-                """
-                INSERT INTO session_messages (
-                    session_id, message_id, message_idx, role, timestamp, payload_json
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (session_id, message_id, message_idx, role, timestamp, payload_json),
-            )
+        # One executemany round-trip to the connection thread instead of one per message
+        await db.executemany(
+            """
+            INSERT INTO session_messages (
+                session_id, message_id, message_idx, role, timestamp, payload_json
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [(session_id, *self._session_message_identity(message, fallback_idx)) for fallback_idx, message in enumerate(messages)],
+        )
 
     async def _load_session_messages(self, db: Any, session_id: str) -> list[dict[str, Any]]:
         """Load one session's transcript payload from canonical transcript rows."""
@@ -2086,6 +2090,34 @@ class SQLiteStore:
             await db.commit()
             return cursor.rowcount > 0
 
+    async def delete_memories(self, entry_ids: list[str]) -> int:
+        """Delete several memories in one transaction.
+
+        Args:
+            entry_ids: Memories to delete
+
+        Returns:
+            Number of memories deleted
+        """
+        if not entry_ids:
+            return 0
+
+        await self._init()
+
+        import aiosqlite
+
+        params = [(entry_id,) for entry_id in entry_ids]
+        async with aiosqlite.connect(self.db_path) as db:
+            # Load sqlite-vec extension for vector search
+            await self._load_extensions(db)
+            # Delete from embeddings first (if exists)
+            with contextlib.suppress(Exception):
+                await db.executemany("DELETE FROM memory_embeddings WHERE entry_id = ?", params)
+
+            cursor = await db.executemany("DELETE FROM memories WHERE entry_id = ?", params)
+            await db.commit()
+            return cursor.rowcount
+
     # === Support Memory Operations ===
 
     async def save_life_domain(self, domain: LifeDomain) -> None:
@@ -2712,6 +2744,20 @@ class SQLiteStore:
             db.row_factory = aiosqlite.Row
             return await self._load_arc_open_loops(db, arc_id)
 
+    async def _load_arc_snapshot(self, db: Any, arc_id: str) -> ArcSnapshot | None:
+        """Load one composed operational-arc snapshot from an existing SQLite connection."""
+        arc = await self._load_operational_arc(db, arc_id)
+        if arc is None:
+            return None
+
+        return ArcSnapshot(
+            arc=arc,
+            tasks=await self._load_arc_tasks(db, arc_id),
+            blockers=await self._load_arc_blockers(db, arc_id),
+            decisions=await self._load_arc_decisions(db, arc_id),
+            open_loops=await self._load_arc_open_loops(db, arc_id),
+        )
+
     async def get_arc_snapshot(self, arc_id: str) -> ArcSnapshot | None:
         """Load one composed operational-arc snapshot from structured storage only."""
         await self._init()
@@ -2722,18 +2768,28 @@ class SQLiteStore:
             await self._load_extensions(db)
             await db.execute("PRAGMA foreign_keys = ON")
             db.row_factory = aiosqlite.Row
+            return await self._load_arc_snapshot(db, arc_id)
 
-            arc = await self._load_operational_arc(db, arc_id)
-            if arc is None:
-                return None
+    async def get_arc_snapshots(self, arc_ids: list[str]) -> list[ArcSnapshot]:
+        """Load several arc snapshots over one connection, skipping unknown arcs."""
+        await self._init()
+        if not arc_ids:
+            return []
 
-            return ArcSnapshot(
-                arc=arc,
-                tasks=await self._load_arc_tasks(db, arc_id),
-                blockers=await self._load_arc_blockers(db, arc_id),
-                decisions=await self._load_arc_decisions(db, arc_id),
-                open_loops=await self._load_arc_open_loops(db, arc_id),
-            )
+        import aiosqlite
+
+        snapshots: list[ArcSnapshot] = []
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._load_extensions(db)
+            await db.execute("PRAGMA foreign_keys = ON")
+            db.row_factory = aiosqlite.Row
+
+            for arc_id in arc_ids:
+                snapshot = await self._load_arc_snapshot(db, arc_id)
+                if snapshot is not None:
+                    snapshots.append(snapshot)
+
+        return snapshots
 
     async def _load_arc_situation(self, db: Any, arc_id: str) -> ArcSituation | None:
         """Load one persisted arc situation from an existing SQLite connection."""
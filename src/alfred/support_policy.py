@@ -18,7 +18,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Protocol, cast
 
-from alfred.embeddings import cosine_similarity
+import numpy as np
+
 from alfred.memory.support_context import ArcResumeContext, get_support_operational_context
 from alfred.memory.support_learning import (
     LearningSituation,
@@ -175,6 +176,13 @@ class NeedPrototypeBank:
     centroids: dict[Need, Vector]
     prototypes: tuple[NeedPrototype, ...]
     top_k: int
+    # Row-normalized matrices so one matmul scores every centroid or prototype
+    _centroid_matrix: np.ndarray = field(init=False, repr=False, compare=False)
+    _prototype_matrix: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_centroid_matrix", _unit_rows(tuple(self.centroids.values())))
+        object.__setattr__(self, "_prototype_matrix", _unit_rows(tuple(prototype.vector for prototype in self.prototypes)))
 
 
 @dataclass(frozen=True)
@@ -421,8 +429,24 @@ def _average_vectors(vectors: Sequence[Vector]) -> Vector:
     return _normalize_vector([value / len(vectors) for value in totals])
 
 
-def _similarity(a: Vector, b: Vector) -> float:
-    return float(cosine_similarity(list(a), list(b)))
+def _unit_rows(vectors: Sequence[Vector]) -> np.ndarray:
+    """Stack vectors into a float64 matrix with unit-length rows; zero rows stay zero."""
+    if not vectors:
+        return np.empty((0, 0))
+    matrix = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms != 0)
+
+
+def _similarities(vector: Vector, unit_rows: np.ndarray) -> list[float]:
+    """Cosine similarity of one vector against every row of a _unit_rows matrix."""
+    if not len(unit_rows):
+        return []
+    query = np.asarray(vector, dtype=np.float64)
+    norm = np.linalg.norm(query)
+    if norm == 0:
+        return [0.0] * len(unit_rows)
+    return cast(list[float], (unit_rows @ (query / norm)).tolist())
 
 
 async def _embed_many(embedder: EmbeddingProvider, texts: Sequence[str]) -> tuple[Vector, ...]:
@@ -478,11 +502,12 @@ def assess_need(
     thresholds: NeedAssessmentThresholds,
 ) -> NeedAssessmentResult:
     """Assess one support need from one embedded turn with deterministic abstention."""
+    centroid_similarities = _similarities(embedded_turn.vector, prototype_bank._centroid_matrix)
     scores = tuple(
         sorted(
             (
-                NeedScore(need=need, similarity=_similarity(embedded_turn.vector, centroid))
-                for need, centroid in prototype_bank.centroids.items()
+                NeedScore(need=need, similarity=similarity)
+                for need, similarity in zip(prototype_bank.centroids, centroid_similarities, strict=True)
             ),
             key=lambda score: score.similarity,
             reverse=True,
@@ -495,15 +520,16 @@ def assess_need(
     second_score = scores[1] if len(scores) > 1 else None
     margin = top_score.similarity - second_score.similarity if second_score is not None else 1.0
 
+    prototype_similarities = _similarities(embedded_turn.vector, prototype_bank._prototype_matrix)
     neighbors = tuple(
         sorted(
             (
                 NeedNeighbor(
                     prototype_id=prototype.prototype_id,
                     need=prototype.need,
-                    similarity=_similarity(embedded_turn.vector, prototype.vector),
+                    similarity=similarity,
                 )
-                for prototype in prototype_bank.prototypes
+                for prototype, similarity in zip(prototype_bank.prototypes, prototype_similarities, strict=True)
             ),
             key=lambda neighbor: neighbor.similarity,
             reverse=True,
@@ -611,13 +637,12 @@ def _has_abstract_grounding(kind: SubjectKind, normalized_turn: str) -> bool:
 def _score_subject_candidate(
     *,
     prototype: SubjectPrototype,
-    embedded_turn: EmbeddedTurn,
+    semantic_similarity: float,
     turn_tokens: Sequence[str],
     normalized_turn: str,
     active_arc_id: str | None,
     active_domain_id: str | None,
 ) -> SubjectCandidate:
-    semantic_similarity = _similarity(embedded_turn.vector, prototype.vector)
     aliases = prototype.aliases or (prototype.text,)
     exact_alias_hit = _exact_alias_hit(normalized_turn, aliases)
     ordered_alias_hit = _ordered_alias_hit(turn_tokens, aliases)
@@ -674,19 +699,20 @@ def resolve_subjects(
     """Resolve ordered subjects from one embedded turn without a compatibility matrix."""
     turn_tokens = _tokenize(embedded_turn.text)
     normalized_turn = _normalize_text(embedded_turn.text)
+    semantic_similarities = _similarities(embedded_turn.vector, _unit_rows(tuple(prototype.vector for prototype in prototypes)))
 
     scored_candidates = tuple(
         sorted(
             (
                 _score_subject_candidate(
                     prototype=prototype,
-                    embedded_turn=embedded_turn,
+                    semantic_similarity=semantic_similarity,
                     turn_tokens=turn_tokens,
                     normalized_turn=normalized_turn,
                     active_arc_id=active_arc_id,
                     active_domain_id=active_domain_id,
                 )
-                for prototype in prototypes
+                for prototype, semantic_similarity in zip(prototypes, semantic_similarities, strict=True)
             ),
             key=lambda candidate: candidate.semantic_similarity,
             reverse=True,
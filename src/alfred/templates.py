@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import os
 import re
 from datetime import date
 from pathlib import Path
@@ -437,10 +438,9 @@ class TemplateManager:
         if self._template_dir is None:
             return []
 
-        templates = []
-        for path in self._template_dir.glob("*.md"):
-            if path.is_file():
-                templates.append(path.name)
+        # scandir reuses the dirent type, so no per-file stat or Path allocation
+        with os.scandir(self._template_dir) as entries:
+            templates = [entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()]
 
         return sorted(templates)
 
@@ -453,10 +453,12 @@ class TemplateManager:
         if not prompts_dir.exists():
             return []
 
+        # os.walk sorts entries by dirent type while scanning, so there is no
+        # extra stat() per file and no Path object until a directory is entered
         prompt_templates: list[str] = []
-        for path in prompts_dir.rglob("*.md"):
-            if path.is_file():
-                prompt_templates.append(path.relative_to(self._template_dir).as_posix())
+        for dirpath, _dirnames, filenames in os.walk(prompts_dir):
+            rel_dir = Path(dirpath).relative_to(self._template_dir).as_posix()
+            prompt_templates.extend(f"{rel_dir}/{name}" for name in filenames if name.endswith(".md"))
         return sorted(prompt_templates)
 
     def is_prompt_template(self, name: str) -> bool:
@@ -13,6 +13,10 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        # Built lazily; pydantic regenerates JSON schemas on every call
+        self._schemas: list[dict[str, Any]] | None = None
+        # Bumped on every change so callers can cache derived data
+        self.version = 0
 
     def register(self, tool: Tool) -> None:
         """Register a tool instance."""
@@ -20,6 +24,8 @@ class ToolRegistry:
             logger.warning(f"Tool '{tool.name}' already registered, overwriting")
 
         self._tools[tool.name] = tool
+        self._schemas = None
+        self.version += 1
         logger.debug(f"Registered tool: {tool.name}")
 
     def get(self, name: str) -> Tool | None:
@@ -32,11 +38,15 @@ class ToolRegistry:
 
     def get_schemas(self) -> list[dict[str, Any]]:
         """Get JSON schemas for all tools."""
-        return [tool.get_schema() for tool in self._tools.values()]
+        if self._schemas is None:
+            self._schemas = [tool.get_schema() for tool in self._tools.values()]
+        return list(self._schemas)
 
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._schemas = None
+        self.version += 1
 
     def __contains__(self, name: str) -> bool:
         """Check if a tool is registered."""
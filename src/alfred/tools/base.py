@@ -106,7 +106,7 @@ class Tool(ABC):
         import asyncio
 
         # Run execute in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(None, lambda: self.execute(**kwargs))
 
         if isinstance(result, str):
@@ -1,7 +1,6 @@
 """Bash command execution tool with streaming support."""
 
 import asyncio
-import os
 import subprocess
 from collections.abc import AsyncIterator
 from typing import Any
@@ -10,6 +9,10 @@ from pydantic import BaseModel, Field
 
 from alfred.tools.base import Tool
 
+# Stream buffer limit for subprocess pipes. asyncio's 64 KiB default makes
+# communicate() drain large outputs in many small reads with pause/resume cycles.
+PIPE_LIMIT = 1024 * 1024
+
 
 class BashToolParams(BaseModel):
     """Parameters for BashTool."""
@@ -50,7 +53,6 @@ class BashTool(Tool):
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=os.getcwd(),
             )
 
             # Truncate output if needed
@@ -119,7 +121,7 @@ class BashTool(Tool):
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=os.getcwd(),
+                limit=PIPE_LIMIT,
             )
 
             try:
@@ -129,16 +131,10 @@ class BashTool(Tool):
                 stdout_text = stdout.decode("utf-8", errors="replace")
                 stderr_text = stderr.decode("utf-8", errors="replace")
 
-                # Yield stdout
+                # Yield stdout in one piece: communicate() already collected it,
+                # so per-line chunks only multiply string copies and tool events
                 if stdout_text:
-                    # Chunk into lines for better streaming
-                    lines = stdout_text.split("\n")
-                    for i, line in enumerate(lines):
-                        if i < len(lines) - 1:  # Not last line
-                            yield line + "\n"
-                        else:  # Last line (might not have newline)
-                            if line:
-                                yield line
+                    yield stdout_text
 
                 # Yield stderr if any
                 if stderr_text:
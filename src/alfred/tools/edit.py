@@ -47,7 +47,8 @@ class EditTool(Tool):
                 }
 
             # Check if old_text exists
-            if old_text not in content:
+            start = content.find(old_text)
+            if start == -1:
                 # Provide context about what was searched
                 snippet = content[:200].replace("\n", " ")
                 if len(content) <= 200:
@@ -59,11 +60,8 @@ class EditTool(Tool):
                     "path": path,
                 }
 
-            # Replace (only first occurrence)
-            new_content = content.replace(old_text, new_text, 1)
-
-            # Check if replacement happened
-            if new_content == content:
+            # Replacing text with itself would leave the file unchanged
+            if old_text == new_text:
                 return {
                     "success": False,
                     "edited": False,
@@ -71,16 +69,20 @@ class EditTool(Tool):
                     "path": path,
                 }
 
-            # Write back
+            # Write back around the first occurrence rather than building a
+            # full-size replaced copy of the file in memory
+            end = start + len(old_text)
             with open(path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+                f.write(content[:start])
+                f.write(new_text)
+                f.write(content[end:])
 
             return {
                 "success": True,
                 "edited": True,
                 "path": path,
                 "replacements": 1,
-                "bytes_changed": len(new_content) - len(content),
+                "bytes_changed": len(new_text) - len(old_text),
             }
 
         except Exception as e:
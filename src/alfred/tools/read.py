@@ -1,6 +1,7 @@
 """Read file contents tool."""
 
 import os
+from itertools import islice
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -47,32 +48,32 @@ class ReadTool(Tool):
             file_size = os.path.getsize(path)
             return f"[Image file: {path}, size: {file_size} bytes, type: {ext[1:]}]"
 
+        if offset and offset < 1:
+            return "Error: offset must be >= 1"
+        if limit and limit < 1:
+            return "Error: limit must be >= 1"
+
+        # Truncate if too long (50KB / 2000 lines)
+        max_bytes = 50000
+        max_lines = 2000
+
+        # Only decode the lines that can end up in the output. One line past
+        # max_lines is enough to trigger truncation below.
+        start = offset - 1 if offset else 0
+        count = min(limit, max_lines + 1) if limit else max_lines + 1
+
         # Read text file
         try:
             with open(path, encoding="utf-8") as f:
-                lines = f.readlines()
+                lines = list(islice(f, start, start + count))
         except UnicodeDecodeError:
             # Binary file
             return f"Error: File appears to be binary: {path}"
         except Exception as e:
             return f"Error reading file: {e}"
 
-        # Apply offset
-        if offset:
-            if offset < 1:
-                return "Error: offset must be >= 1"
-            lines = lines[offset - 1 :]
-
-        # Apply limit
-        if limit:
-            lines = lines[:limit]
-
         result = "".join(lines)
 
-        # Truncate if too long (50KB / 2000 lines)
-        max_bytes = 50000
-        max_lines = 2000
-
         if len(result) > max_bytes or len(lines) > max_lines:
             # Truncate to safe limits
             result_lines = result.split("\n")[:max_lines]
@@ -4,6 +4,7 @@ import logging
 import uuid
 from collections.abc import AsyncIterator
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
@@ -395,10 +396,9 @@ class SearchSessionsTool(Tool):
 
             relevant_summaries = await self._find_relevant_sessions(query_embedding, top_k, after=after, before=before)
             logger.debug(f"Found {len(relevant_summaries)} summaries")
-            for s in relevant_summaries:
-                sid = s.get("session_id", "")
-                sim = s.get("similarity", 0)
-                logger.debug(f"  Summary: {sid[:8]}... sim={sim:.3f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for s in relevant_summaries:
+                    logger.debug("  Summary: %s... sim=%.3f", s.get("session_id", "")[:8], s.get("similarity", 0))
 
             # If no summaries found, fall back to direct message search
             if not relevant_summaries:
@@ -427,7 +427,7 @@ class SearchSessionsTool(Tool):
                     return
 
                 # Yield results grouped by session
-                for session_id, messages in list(sessions_by_id.items())[:top_k]:
+                for session_id, messages in islice(sessions_by_id.items(), top_k):
                     yield f"\n## Session: {session_id}\n"
                     yield "Found relevant messages (no summary available):\n"
 
@@ -460,7 +460,7 @@ class SearchSessionsTool(Tool):
 
                     if fallback_sessions:
                         yield "\n(Found summaries but below threshold; showing message matches instead)\n"
-                        for session_id, messages in list(fallback_sessions.items())[:top_k]:
+                        for session_id, messages in islice(fallback_sessions.items(), top_k):
                             yield f"\n## Session: {session_id}\n"
                             for msg in messages[:messages_per_session]:
                                 role = msg["role"]
@@ -4,11 +4,37 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory for asyncio.run(), if uvloop is installed.
+
+    uvloop comes in with uvicorn[standard] on POSIX platforms and cuts the
+    per-callback cost of streaming and socket reads. Returns None when it is
+    unavailable, so asyncio.run() falls back to the default loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def install_default_executor(max_workers: int) -> None:
+    """Size the running loop's default executor used by run_in_executor offloads.
+
+    The stdlib default is min(32, cpu_count + 4), which leaves small hosts
+    with a handful of threads shared by file reads and blocking tools. Every
+    long-running entry point calls this first with ``config.io_thread_pool_size``.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="alfred-io"))
+
+
 def run_async(coro: Any) -> Any:
     """Run async coroutine from sync code safely.
 
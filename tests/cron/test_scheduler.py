@@ -68,6 +68,20 @@ class TestCronSchedulerStartStop:
         assert scheduler._shutdown_event.is_set()
         assert scheduler._task is None or scheduler._task.done()
 
+    async def test_shutdown_event_wakes_monitor_loop(self, temp_data_dir: Path):
+        """Setting the shutdown event ends the loop without waiting out the interval."""
+        store = CronStore(data_dir=temp_data_dir)
+        scheduler = CronScheduler(store=store, check_interval=60)
+        await scheduler.start()
+        task = scheduler._task
+        assert task is not None
+
+        scheduler._shutdown_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+        assert task.done() and not task.cancelled()
+        await scheduler.stop()
+
     async def test_stop_without_start_succeeds(self, temp_data_dir: Path):
         """stop() can be called even if start() was never called."""
         store = CronStore(data_dir=temp_data_dir)
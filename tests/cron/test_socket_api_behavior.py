@@ -336,6 +336,128 @@ class TestSocketAPIRoundTrip:
         query_response = await client.query_jobs()
         assert len(query_response.jobs) == 0
 
+    @pytest.mark.asyncio
+    async def test_large_submit_request_round_trips(self, socket_system):
+        """Behavior: Job code larger than asyncio's 64 KiB line default still reaches the scheduler."""
+        client = socket_system["client"]
+        scheduler = socket_system["scheduler"]
+
+        code = f"async def run(): pass\n# {'x' * 100_000}\n"
+
+        response = await client.submit_job(
+            name="Big Job",
+            expression="0 9 * * *",
+            code=code,
+        )
+
+        assert isinstance(response, SubmitJobResponse)
+        assert response.success is True
+        jobs = await scheduler._store.load_jobs()
+        assert [job.code for job in jobs] == [code]
+        assert client.is_connected
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_connection(self, socket_system):
+        """Behavior: Requests in flight at the same time each get their own response."""
+        client = socket_system["client"]
+
+        submit_response, query_response, ping_ok = await asyncio.gather(
+            client.submit_job(
+                name="Concurrent Job",
+                expression="0 9 * * *",
+                code="async def run(): pass",
+            ),
+            client.query_jobs(),
+            client.ping(),
+        )
+
+        assert isinstance(submit_response, SubmitJobResponse)
+        assert submit_response.success is True
+        assert isinstance(query_response, QueryJobsResponse)
+        assert ping_ok is True
+
+
+class TestSocketClientReconnect:
+    """Test that the client notices a dropped connection and reconnects."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_connection_drops(self, tmp_path):
+        """Behavior: Client notices the server hanging up and reconnects."""
+        socket_path = tmp_path / "test.sock"
+        connections = 0
+
+        async def hang_up(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal connections
+            connections += 1
+            writer.close()
+
+        flaky_server = await asyncio.start_unix_server(hang_up, path=str(socket_path))
+
+        client = SocketClient(retry_interval=0.05)
+        client.socket_path = socket_path
+        await client.start()
+        await asyncio.sleep(0.2)
+        assert connections >= 2
+
+        flaky_server.close()
+        await flaky_server.wait_closed()
+
+        server = SocketServer()
+        server.socket_path = socket_path
+        await server.start()
+        await asyncio.sleep(0.2)
+
+        assert client.is_connected
+        assert await client.ping() is True
+
+        await client.stop()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_waits_between_reconnects_when_server_keeps_hanging_up(self, tmp_path):
+        """Behavior: A server that accepts then closes every connection doesn't make the client spin."""
+        socket_path = tmp_path / "test.sock"
+        connections = 0
+
+        async def hang_up(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal connections
+            connections += 1
+            writer.close()
+
+        flaky_server = await asyncio.start_unix_server(hang_up, path=str(socket_path))
+
+        client = SocketClient(retry_interval=0.1)
+        client.socket_path = socket_path
+        await client.start()
+        await asyncio.sleep(0.35)
+        await client.stop()
+
+        flaky_server.close()
+        await flaky_server.wait_closed()
+
+        # One connection per retry interval, not one per event-loop turn
+        assert 2 <= connections <= 5
+
+    @pytest.mark.asyncio
+    async def test_server_stop_disconnects_connected_clients(self, tmp_path):
+        """Behavior: Stopping the server hangs up on clients instead of waiting for them."""
+        socket_path = tmp_path / "test.sock"
+        server = SocketServer()
+        server.socket_path = socket_path
+        await server.start()
+
+        client = SocketClient(retry_interval=0.05)
+        client.socket_path = socket_path
+        await client.start()
+        await asyncio.sleep(0.1)
+        assert client.is_connected
+
+        await asyncio.wait_for(server.stop(), timeout=2.0)
+        await asyncio.sleep(0.1)
+        assert not client.is_connected
+
+        await client.stop()
+
 
 class TestSocketAPIErrorHandling:
     """Test error handling behavior in socket API."""
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from alfred.cron.models import ExecutionRecord, ExecutionStatus, Job
-from alfred.cron.store import CronStore
+from alfred.cron.store import INLINE_IO_THRESHOLD, CronStore
 
 
 @pytest.fixture
@@ -175,6 +175,40 @@ class TestLoadJobs:
         assert "also-valid" in [j.job_id for j in jobs]
         assert "Skipping corrupt line" in caplog.text
 
+    async def test_load_jobs_returns_independent_objects(self, store: CronStore):
+        """Mutating a loaded job does not leak into later loads."""
+        await store.save_job(Job(job_id="job-1", name="Job 1", expression="* * * * *", code="pass", status="active"))
+
+        first = await store.load_jobs()
+        first[0].status = "paused"
+        second = await store.load_jobs()
+
+        assert second[0].status == "active"
+        assert second[0] is not first[0]
+
+    async def test_load_jobs_sees_external_rewrite(self, store: CronStore):
+        """Changes made to cron.jsonl outside the store are picked up."""
+        await store.save_job(Job(job_id="job-1", name="Job 1", expression="* * * * *", code="pass", status="active"))
+        assert [j.job_id for j in await store.load_jobs()] == ["job-1"]
+
+        store.jobs_path.write_text(
+            '{"job_id": "external", "name": "External Job", "expression": "*/5 * * * *", "code": "pass", "status": "active"}\n'
+        )
+
+        jobs = await store.load_jobs()
+
+        assert [j.job_id for j in jobs] == ["external"]
+
+    async def test_load_jobs_larger_than_inline_threshold(self, store: CronStore):
+        """Files above the inline I/O threshold still round-trip through aiofiles."""
+        code = "x = 1\n" * (INLINE_IO_THRESHOLD // 6 + 1)
+        await store.save_job(Job(job_id="big", name="Big Job", expression="* * * * *", code=code, status="active"))
+
+        assert store.jobs_path.stat().st_size >= INLINE_IO_THRESHOLD
+        jobs = await store.load_jobs()
+
+        assert jobs[0].code == code
+
 
 class TestDeleteJob:
     """Tests for deleting jobs."""
@@ -318,6 +352,27 @@ class TestGetJobHistory:
 
         assert len(history) == 5
 
+    async def test_get_history_limit_keeps_newest_records(self, store: CronStore):
+        """Limited history keeps the newest records regardless of append order."""
+        for minute in (3, 9, 1, 7, 5):
+            await store.record_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{minute}",
+                    job_id="job-1",
+                    started_at=datetime(2026, 2, 18, 10, minute, 0, tzinfo=UTC),
+                    ended_at=datetime(2026, 2, 18, 10, minute, 1, tzinfo=UTC),
+                    status=ExecutionStatus.SUCCESS,
+                    duration_ms=1000,
+                )
+            )
+        with store.history_path.open("a") as f:
+            f.write("{not json\n")
+
+        history = await store.get_job_history("job-1", limit=3)
+
+        assert [record.execution_id for record in history] == ["exec-9", "exec-7", "exec-5"]
+        assert await store.get_job_history("job-", limit=3) == []
+
 
 class TestAtomicWrites:
     """Tests for atomic write operations."""
@@ -106,7 +106,7 @@ class TestE2EJobExecution:
         await scheduler.approve_job(job_id, "test")
 
         # Trigger execution manually
-        await scheduler._check_jobs()
+        scheduler._check_jobs()
 
         # Verify job is registered
         assert job_id in scheduler._jobs
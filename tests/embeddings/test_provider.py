@@ -1,5 +1,7 @@
 """Tests for EmbeddingProvider abstraction and implementations."""
 
+import asyncio
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -141,6 +143,25 @@ class TestOpenAIProvider:
         """OpenAI text-embedding-3-small produces 1536-dimensional embeddings."""
         assert provider.dimension == 1536
 
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_embeds_share_one_request(self, provider: "OpenAIProvider") -> None:
+        """Concurrent embed() calls for the same text should hit the API once."""
+        calls: list[str] = []
+
+        async def create(*, model: str, input: str, encoding_format: str) -> SimpleNamespace:
+            calls.append(input)
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(input))])])
+
+        provider._client = SimpleNamespace(embeddings=SimpleNamespace(create=create))  # type: ignore[assignment]
+
+        first, second, other = await asyncio.gather(provider.embed("hello"), provider.embed("hello"), provider.embed("hi"))
+
+        assert first == second == [5.0]
+        assert other == [2.0]
+        assert sorted(calls) == ["hello", "hi"]
+        assert provider._pending == {}
+
 
 class TestProviderFactory:
     """Test provider factory function."""
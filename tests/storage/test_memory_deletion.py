@@ -0,0 +1,35 @@
+"""Tests for batched memory deletion in SQLiteStore."""
+
+from __future__ import annotations
+
+import pytest
+
+from alfred.storage.sqlite import SQLiteStore
+
+
+@pytest.fixture
+async def sqlite_store(tmp_path):
+    """Create a temporary SQLiteStore for memory deletion tests."""
+    store = SQLiteStore(tmp_path / "memories.db")
+    await store._init()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_delete_memories_removes_only_listed_entries(sqlite_store):
+    """Batched deletion should remove the listed memories and report how many existed."""
+    for entry_id in ("mem-1", "mem-2", "mem-3"):
+        await sqlite_store.add_memory(entry_id=entry_id, role="user", content=f"note {entry_id}")
+
+    deleted = await sqlite_store.delete_memories(["mem-1", "mem-3", "mem-missing"])
+
+    assert deleted == 2
+    assert await sqlite_store.get_memory("mem-1") is None
+    assert await sqlite_store.get_memory("mem-2") is not None
+    assert await sqlite_store.get_memory("mem-3") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_memories_with_no_ids_is_a_no_op(sqlite_store):
+    """An empty batch should not touch the database."""
+    assert await sqlite_store.delete_memories([]) == 0
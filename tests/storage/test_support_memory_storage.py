@@ -569,3 +569,50 @@ async def test_arc_snapshot_reads_structured_work_state_without_transcript_searc
     async with aiosqlite.connect(sqlite_store.db_path) as db, db.execute("SELECT COUNT(*) FROM sessions") as cursor:
         row = await cursor.fetchone()
         assert row[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_arc_snapshots_load_in_requested_order_and_skip_unknown_arcs(sqlite_store):
+    """Batch snapshot loading should keep caller order and drop arcs that do not exist."""
+    domain = LifeDomain(
+        domain_id="domain-work",
+        name="Work",
+        status="active",
+        salience=0.97,
+        created_at=datetime(2026, 3, 30, 14, 0, tzinfo=UTC),
+        updated_at=datetime(2026, 3, 30, 14, 5, tzinfo=UTC),
+    )
+    arcs = [
+        OperationalArc(
+            arc_id=f"arc-{name}",
+            title=name.title(),
+            kind="project",
+            primary_domain_id=domain.domain_id,
+            status="active",
+            salience=0.9,
+            created_at=datetime(2026, 3, 30, 14, 10, tzinfo=UTC),
+            updated_at=datetime(2026, 3, 30, 14, 20, tzinfo=UTC),
+            last_active_at=datetime(2026, 3, 30, 14, 19, tzinfo=UTC),
+        )
+        for name in ("alpha", "beta")
+    ]
+    task = ArcTask(
+        task_id="task-beta",
+        arc_id="arc-beta",
+        title="Ship beta",
+        status="todo",
+        created_at=datetime(2026, 3, 30, 14, 21, tzinfo=UTC),
+        updated_at=datetime(2026, 3, 30, 14, 22, tzinfo=UTC),
+    )
+
+    await sqlite_store.save_life_domain(domain)
+    for arc in arcs:
+        await sqlite_store.save_operational_arc(arc)
+    await sqlite_store.save_arc_task(task)
+
+    snapshots = await sqlite_store.get_arc_snapshots(["arc-beta", "arc-missing", "arc-alpha"])
+
+    assert [snapshot.arc.arc_id for snapshot in snapshots] == ["arc-beta", "arc-alpha"]
+    assert snapshots[0] == await sqlite_store.get_arc_snapshot("arc-beta")
+    assert snapshots[0].tasks == [task]
+    assert await sqlite_store.get_arc_snapshots([]) == []
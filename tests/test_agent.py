@@ -285,3 +285,13 @@ class TestAgent:
         # Check that system prompt was added
         assert captured_messages is not None
         assert any(m.role == "system" for m in captured_messages)
+
+    def test_is_error_detects_indicators(self, mock_llm, mock_tool_registry):
+        """Test error detection over tool output."""
+        agent = Agent(mock_llm, mock_tool_registry)
+
+        assert agent._is_error("Traceback (most recent call last):")
+        assert agent._is_error("line 1\nError: file not found")
+        assert agent._is_error("❌ command exited with 1")
+        assert not agent._is_error("All 12 checks passed")
+        assert not agent._is_error("")
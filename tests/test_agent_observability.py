@@ -41,13 +41,13 @@ async def test_execute_tool_with_events_logs_tool_lifecycle_metadata(
         result = await agent._execute_tool_with_events(call, tool, on_event)
 
     assert result == "alphabeta"
-    assert len(events) == 4
+    assert len(events) == 3
     assert isinstance(events[0], ToolStart)
     assert isinstance(events[1], ToolOutput)
-    assert isinstance(events[2], ToolOutput)
-    assert isinstance(events[3], ToolEnd)
-    assert events[3].result == "alphabeta"
-    assert events[3].is_error is False
+    assert events[1].chunk == "alphabeta"
+    assert isinstance(events[2], ToolEnd)
+    assert events[2].result == "alphabeta"
+    assert events[2].is_error is False
 
     agent_messages = [record.message for record in caplog.records if record.name == "alfred.agent"]
     assert any(message.startswith("event=tools.tool.start") for message in agent_messages)
@@ -1,11 +1,12 @@
 """Tests for Agent.run_stream refactoring."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from alfred.agent import Agent, ToolCall, ToolEnd, ToolOutput, ToolStart
+from alfred.agent import TOOL_OUTPUT_FLUSH_CHARS, TOOL_OUTPUT_FLUSH_SECONDS, Agent, ToolCall, ToolEnd, ToolOutput, ToolStart
 from alfred.llm import ChatMessage
 from alfred.tools import Tool, ToolRegistry, clear_registry
 
@@ -72,22 +73,50 @@ class TestExecuteToolWithEvents:
             result = await agent._execute_tool_with_events(call, tool, event_callback)
 
         assert result == "output chunk 1output chunk 2"
-        assert len(events) == 4  # ToolStart, ToolOutput (x2), ToolEnd
+        assert len(events) == 3  # ToolStart, ToolOutput (batched), ToolEnd
         assert isinstance(events[0], ToolStart)
         assert events[0].tool_call_id == "call_1"
         assert events[0].tool_name == "test_tool"
         assert events[0].arguments == {"key": "value"}
         assert isinstance(events[1], ToolOutput)
-        assert isinstance(events[2], ToolOutput)
-        assert isinstance(events[3], ToolEnd)
-        assert events[3].result == "output chunk 1output chunk 2"
-        assert not events[3].is_error
+        assert events[1].chunk == "output chunk 1output chunk 2"
+        assert isinstance(events[2], ToolEnd)
+        assert events[2].result == "output chunk 1output chunk 2"
+        assert not events[2].is_error
 
         agent_messages = [record.message for record in caplog.records if record.name == "alfred.agent"]
         assert any(message.startswith("event=tools.tool.start") for message in agent_messages)
         assert any(message.startswith("event=tools.tool.completed") for message in agent_messages)
         assert any("output_chars=28" in message for message in agent_messages)
 
+    @pytest.mark.asyncio
+    async def test_execute_tool_flushes_output_after_pause(self, mock_llm, mock_tool_registry):
+        """Test that buffered tool output is emitted while the tool is still running."""
+        agent = Agent(mock_llm, mock_tool_registry)
+        events = []
+        emitted_during_pause = []
+
+        async def mock_stream(arguments):
+            yield "first"
+            await asyncio.sleep(TOOL_OUTPUT_FLUSH_SECONDS * 3)
+            emitted_during_pause.extend(e.chunk for e in events if isinstance(e, ToolOutput))
+            yield "x" * TOOL_OUTPUT_FLUSH_CHARS
+            yield "last"
+
+        tool = MagicMock(spec=Tool)
+        tool.name = "slow_tool"
+        tool.validate_and_run_stream = mock_stream
+
+        call = ToolCall(id="call_3", name="slow_tool", arguments={})
+        result = await agent._execute_tool_with_events(call, tool, events.append)
+
+        assert result == "first" + "x" * TOOL_OUTPUT_FLUSH_CHARS + "last"
+        # The first chunk went out on the timer, before the tool finished
+        assert emitted_during_pause == ["first"]
+        assert [e.chunk for e in events if isinstance(e, ToolOutput)] == ["first", "x" * TOOL_OUTPUT_FLUSH_CHARS, "last"]
+        assert isinstance(events[-1], ToolEnd)
+        assert events[-1].is_error is False
+
     @pytest.mark.asyncio
     async def test_execute_tool_error(self, mock_llm, mock_tool_registry, caplog: pytest.LogCaptureFixture):
         """Test tool execution with error."""
@@ -210,6 +239,86 @@ class TestAgentRunStreamIntegration:
         assert any(isinstance(e, ToolStart) for e in events)
         assert any(isinstance(e, ToolEnd) for e in events)
 
+    @pytest.mark.asyncio
+    async def test_run_stream_leaves_caller_messages_untouched(self, mock_llm, mock_tool_registry):
+        """Test that tool-call turns are not appended to the caller's list."""
+        agent = Agent(mock_llm, mock_tool_registry, max_iterations=3)
+
+        call_count = 0
+
+        async def mock_stream(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+
+            if call_count == 1:
+                tool_calls = [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "read", "arguments": json.dumps({"path": "test.txt"})},
+                    }
+                ]
+                yield f"[TOOL_CALLS]{json.dumps(tool_calls)}"
+            else:
+                yield "Done"
+
+        mock_llm.stream_chat_with_tools = mock_stream
+
+        messages = [ChatMessage(role="user", content="Read file")]
+        async for _chunk in agent.run_stream(messages):
+            pass
+
+        assert call_count == 2
+        assert [m.role for m in messages] == ["user"]
+
+    @pytest.mark.asyncio
+    async def test_run_stream_echoes_provider_tool_arguments(self, mock_llm, mock_tool_registry):
+        """Test that the assistant turn carries the provider's raw argument JSON."""
+        agent = Agent(mock_llm, mock_tool_registry, max_iterations=3)
+        raw_arguments = '{"path":  "test.txt"}'
+        seen_messages = []
+
+        async def mock_stream(messages, **kwargs):
+            seen_messages.append(list(messages))
+            if len(seen_messages) == 1:
+                tool_calls = [{"id": "call_1", "type": "function", "function": {"name": "read", "arguments": raw_arguments}}]
+                yield f"[TOOL_CALLS]{json.dumps(tool_calls)}"
+            else:
+                yield "Done"
+
+        mock_llm.stream_chat_with_tools = mock_stream
+
+        async for _chunk in agent.run_stream([ChatMessage(role="user", content="Read file")]):
+            pass
+
+        assistant_msg = seen_messages[1][1]
+        assert assistant_msg.tool_calls[0]["function"]["arguments"] == raw_arguments
+
+    @pytest.mark.asyncio
+    async def test_run_stream_fills_missing_tool_call_fields(self, mock_llm, mock_tool_registry):
+        """Test that tool calls without id or type are completed before being echoed back."""
+        agent = Agent(mock_llm, mock_tool_registry, max_iterations=3)
+        seen_messages = []
+
+        async def mock_stream(messages, **kwargs):
+            seen_messages.append(list(messages))
+            if len(seen_messages) == 1:
+                tool_calls = [{"function": {"name": "read", "arguments": '{"path": "test.txt"}'}}]
+                yield f"[TOOL_CALLS]{json.dumps(tool_calls)}"
+            else:
+                yield "Done"
+
+        mock_llm.stream_chat_with_tools = mock_stream
+
+        async for _chunk in agent.run_stream([ChatMessage(role="user", content="Read file")]):
+            pass
+
+        assistant_msg, tool_msg = seen_messages[1][1:3]
+        assert assistant_msg.tool_calls == [
+            {"id": "call_0", "type": "function", "function": {"name": "read", "arguments": '{"path": "test.txt"}'}}
+        ]
+        assert tool_msg.tool_call_id == "call_0"
+
     @pytest.mark.asyncio
     async def test_run_stream_tool_not_found(self, mock_llm, mock_tool_registry):
         """Test run_stream when requested tool doesn't exist."""
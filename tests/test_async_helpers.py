@@ -0,0 +1,46 @@
+"""Tests for async runtime helpers."""
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from alfred.utils.async_helpers import event_loop_factory, install_default_executor
+
+
+def test_event_loop_factory_uses_uvloop_when_installed() -> None:
+    """asyncio.run() gets uvloop's loop when it is importable."""
+    uvloop = pytest.importorskip("uvloop")
+
+    factory = event_loop_factory()
+
+    assert factory is uvloop.new_event_loop
+    assert asyncio.run(asyncio.sleep(0, result="ok"), loop_factory=factory) == "ok"
+
+
+def test_event_loop_factory_falls_back_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without uvloop, the default asyncio loop is used."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert event_loop_factory() is None
+
+
+def test_install_default_executor_sizes_run_in_executor_pool() -> None:
+    """run_in_executor offloads use the configured number of alfred-io threads."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blocking() -> str:
+        # Both workers must be busy at once, proving the pool holds two threads
+        barrier.wait()
+        return threading.current_thread().name
+
+    async def main() -> list[str]:
+        install_default_executor(2)
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(None, blocking) for _ in range(4)))
+
+    names = asyncio.run(main())
+
+    assert all(name.startswith("alfred-io") for name in names)
+    assert len(set(names)) == 2
@@ -23,3 +23,22 @@ def test_python_module_entrypoint_reaches_webui_command() -> None:
     output = result.stdout + result.stderr
     assert "Launch web interface" in output
     assert "Port to run the Web UI server on" in output
+
+
+def test_cli_import_defers_config_and_cron_storage() -> None:
+    """Importing the CLI app should not load config, cron storage, or rich renderables."""
+    deferred = ["alfred.config", "alfred.cron.store", "alfred.cron.socket_client", "rich.table", "rich.syntax"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, alfred.cli.main; print([name for name in {deferred!r} if name in sys.modules])",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -43,13 +43,14 @@ def test_run_webui_server_bootstraps_daemon_before_starting_uvicorn(monkeypatch)
         bootstrap_calls += 1
         return bootstrap_result
 
-    def fake_create_app(*, alfred_instance, debug: bool = False):
+    def fake_create_app(*, alfred_instance, debug: bool = False, io_thread_pool_size: int | None = None):
         app = SimpleNamespace(state=SimpleNamespace())
         app.state.alfred = alfred_instance
+        app.state.io_thread_pool_size = io_thread_pool_size
         return app
 
     monkeypatch.setattr("alfred.data_manager.init_xdg_directories", lambda: None)
-    monkeypatch.setattr("alfred.config.load_config", lambda: SimpleNamespace(data_dir=Path("/tmp/alfred-data")))
+    monkeypatch.setattr("alfred.config.load_config", lambda: SimpleNamespace(data_dir=Path("/tmp/alfred-data"), io_thread_pool_size=8))
     monkeypatch.setattr("alfred.alfred.Alfred", FakeAlfred)
     monkeypatch.setattr("alfred.interfaces.webui.server.create_app", fake_create_app)
     monkeypatch.setattr("alfred.cli.webui_hotswap.bootstrap_daemon", fake_bootstrap_daemon)
@@ -59,3 +60,4 @@ def test_run_webui_server_bootstraps_daemon_before_starting_uvicorn(monkeypatch)
 
     assert bootstrap_calls == 1
     assert len(configured_apps) == 1
+    assert configured_apps[0].state.io_thread_pool_size == 8
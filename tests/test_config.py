@@ -162,3 +162,23 @@ budget = 32000
         config = load_config(config_path=config_path)
 
         assert config.memory_warning_threshold == 1000
+
+
+def test_io_thread_pool_size_loads_from_toml():
+    """Verify [runtime] io_threads maps to io_thread_pool_size (default 32)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.toml"
+        config_path.write_text("""
+[provider]
+default = "kimi"
+""")
+        assert load_config(config_path=config_path).io_thread_pool_size == 32
+
+        config_path.write_text("""
+[provider]
+default = "kimi"
+
+[runtime]
+io_threads = 8
+""")
+        assert load_config(config_path=config_path).io_thread_pool_size == 8
@@ -1,5 +1,6 @@
 """Integration tests for ContextLoader template auto-creation."""
 
+import os
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -179,6 +180,32 @@ class TestContextLoaderTemplateAutoCreation:
 
         assert first.content == second.content
 
+    @pytest.mark.asyncio
+    async def test_unchanged_mtime_reuses_cache_without_reading(self, loader, config, monkeypatch):
+        """A cached file is only re-read once its mtime changes."""
+        soul_path = config.context_files["soul"]
+        first = await loader.load_file("soul", soul_path)
+
+        reads: list[Path] = []
+        original_read_text = Path.read_text
+
+        def tracking_read_text(self: Path, *args, **kwargs) -> str:
+            if self == soul_path:
+                reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read_text)
+
+        second = await loader.load_file("soul", soul_path)
+        assert second.content == first.content
+        assert reads == []
+
+        stat = soul_path.stat()
+        soul_path.write_text("# Rewritten soul\n", encoding="utf-8")
+        os.utime(soul_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert (await loader.load_file("soul", soul_path)).content == "# Rewritten soul\n"
+        assert reads == [soul_path]
+
     @pytest.mark.asyncio
     async def test_assemble_creates_missing_files(self, loader, config):
         """assemble() creates missing context files."""
@@ -306,7 +333,7 @@ class TestContextLoaderBlockedTemplates:
         loader_with_store = ContextLoader(config, cache_dir=cache_dir, store=FakeSearchStore())
         system_prompt, memories_count = await loader_with_store.assemble_with_search(
             query_embedding=[0.1, 0.2, 0.3],
-            memories=[],
+            available_memories=0,
         )
 
         assert memories_count == 0
@@ -80,7 +80,7 @@ async def test_context_builder_emits_compact_derived_tool_outcomes() -> None:
 
     context, included = await builder.build_context(
         query_embedding=[0.1, 0.2, 0.3],
-        memories=[],
+        available_memories=0,
         system_prompt="## SYSTEM\n\nBase prompt",
         session_messages=session_messages,
         session_messages_with_tools=[assistant_message],
@@ -121,7 +121,7 @@ async def test_context_builder_trims_derived_tool_outcomes_when_budget_is_tight(
 
     context, included = await builder.build_context(
         query_embedding=[0.1, 0.2, 0.3],
-        memories=[],
+        available_memories=0,
         system_prompt="## SYSTEM\n\nBase prompt",
         session_messages=[("user", "Run"), ("assistant", "Done")],
         session_messages_with_tools=[assistant_message],
@@ -155,7 +155,7 @@ async def test_context_builder_fills_remaining_budget_with_session_messages() ->
 
     context, included = await builder.build_context(
         query_embedding=[0.1, 0.2, 0.3],
-        memories=memories,
+        available_memories=len(memories),
         system_prompt="## SYSTEM\n\nBase prompt",
         session_messages=session_messages,
     )
@@ -167,6 +167,25 @@ async def test_context_builder_fills_remaining_budget_with_session_messages() ->
     assert context.index("Middle session message") < context.index("Newest session message")
 
 
+@pytest.mark.asyncio
+async def test_context_builder_skips_memory_search_for_empty_store() -> None:
+    """An empty memory store should not trigger a vector search."""
+
+    store = FakeMemoryStore(results=[])
+    builder = ContextBuilder(store, memory_budget=4096)
+
+    context, included = await builder.build_context(
+        query_embedding=[0.1, 0.2, 0.3],
+        available_memories=0,
+        system_prompt="## SYSTEM\n\nBase prompt",
+        session_messages=[("user", "hello")],
+    )
+
+    assert included == 0
+    assert "hello" in context
+    assert store.calls == []
+
+
 @pytest.mark.asyncio
 async def test_context_builder_logs_assembly_summary_and_budget_usage(
     caplog: pytest.LogCaptureFixture,
@@ -205,7 +224,7 @@ async def test_context_builder_logs_assembly_summary_and_budget_usage(
     with caplog.at_level(logging.DEBUG, logger="alfred.context"):
         context, included = await builder.build_context(
             query_embedding=[0.1, 0.2, 0.3],
-            memories=memories,
+            available_memories=len(memories),
             system_prompt="## SYSTEM\n\nBase prompt",
             session_messages=[("user", "hello"), ("assistant", "hi")],
         )
@@ -262,7 +281,7 @@ async def test_context_builder_logs_truncation_when_budget_is_exceeded(
     with caplog.at_level(logging.DEBUG, logger="alfred.context"):
         context, included = await builder.build_context(
             query_embedding=[0.4, 0.5, 0.6],
-            memories=memories,
+            available_memories=len(memories),
             system_prompt="## SYSTEM\n\n" + ("S" * 400),
             session_messages=[("user", "hello"), ("assistant", "hi")],
         )
@@ -43,6 +43,10 @@ class FakeMemoryStore:
         self.calls += 1
         return list(self.entries)
 
+    async def count_entries(self) -> int:
+        self.calls += 1
+        return len(self.entries)
+
 
 @dataclass
 class FakeContextLoader:
@@ -59,7 +63,7 @@ class FakeContextLoader:
     async def assemble_with_search(
         self,
         query_embedding: list[float],
-        memories: list[Any],
+        available_memories: int,
         session_messages: list[tuple[str, str]] | None = None,
         session_messages_with_tools: list[Any] | None = None,
         alfred: Any | None = None,
@@ -67,7 +71,7 @@ class FakeContextLoader:
         self.calls.append(
             {
                 "query_embedding": list(query_embedding),
-                "memories_count": len(memories),
+                "memories_count": available_memories,
                 "session_messages_count": len(session_messages or []),
                 "session_messages_with_tools_count": len(session_messages_with_tools or []),
                 "alfred": alfred,
@@ -147,6 +151,8 @@ class FakeAgent:
 class FakeTools:
     """Tiny tool registry fake used only for prompt rendering."""
 
+    version = 0
+
     def list_tools(self) -> list[Any]:
         return []
 
@@ -211,6 +217,9 @@ class FakeSessionManager:
     async def _persist_messages_strict(self, session_id: str, messages: list[Message]) -> None:
         self.strict_persist_calls.append((session_id, len(messages)))
 
+    async def _persist_messages(self, session_id: str, messages: list[Message]) -> None:
+        self.persist_calls.append((session_id, len(messages)))
+
     def _spawn_persist_task(self, session_id: str, messages: list[Message]) -> None:
         self.persist_calls.append((session_id, len(messages)))
 
@@ -271,6 +280,7 @@ def _make_alfred(tmp_path: Path) -> tuple[Alfred, FakeContextLoader, FakeAgent,
     alfred.context_loader = context_loader
     alfred.agent = agent
     alfred.tools = FakeTools()
+    alfred._tools_section = None
     alfred.token_tracker = TokenTracker()
     alfred._last_usage = None
     alfred.context_summary = ContextSummary()
@@ -479,6 +489,132 @@ async def test_chat_stream_records_ordered_text_blocks_around_tool_calls(
     assert assistant_message.reasoning_blocks[0].content == "thinking"
 
 
+@pytest.mark.asyncio
+async def test_chat_stream_embeds_and_counts_memories_concurrently(
+    tmp_path: Path,
+) -> None:
+    """The query embedding and the memory count should be awaited together."""
+
+    alfred, context_loader, _, _ = _make_alfred(tmp_path)
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    class GatedEmbedder:
+        async def embed(self, message: str) -> list[float]:
+            started.append("embed")
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return [0.4, 0.5, 0.6]
+
+    class GatedMemoryStore:
+        async def count_entries(self) -> int:
+            started.append("count")
+            both_started.set()
+            return 7
+
+    alfred.core.embedder = GatedEmbedder()
+    alfred.core.memory_store = GatedMemoryStore()
+
+    chunks = [chunk async for chunk in alfred.chat_stream("hello world")]
+
+    assert chunks == ["Hello", " world"]
+    assert started == ["embed", "count"]
+    assert context_loader.calls[0]["query_embedding"] == [0.4, 0.5, 0.6]
+    assert context_loader.calls[0]["memories_count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_embeds_fresh_user_message_once(
+    tmp_path: Path,
+) -> None:
+    """A fresh turn's query embedding and the user message's persist share one request."""
+
+    from unittest.mock import AsyncMock, MagicMock
+
+    from alfred.embeddings.openai_provider import OpenAIProvider
+    from alfred.session import SessionManager
+
+    requested: list[str] = []
+
+    class CountingProvider(OpenAIProvider):
+        """OpenAI provider with the API call replaced by a counter."""
+
+        def __init__(self) -> None:
+            self._pending = {}
+
+        async def _embed_single(self, text: str) -> list[float]:
+            requested.append(text)
+            await asyncio.sleep(0)
+            return [0.1, 0.2, 0.3]
+
+        async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+            requested.extend(texts)
+            await asyncio.sleep(0)
+            return [[0.1, 0.2, 0.3] for _ in texts]
+
+    store = MagicMock()
+    store.load_session = AsyncMock(return_value=None)
+    store.save_session = AsyncMock(return_value=None)
+    embedder = CountingProvider()
+    session_manager = SessionManager(store=store, data_dir=tmp_path, embedder=embedder)
+    session = session_manager.start_session()
+
+    alfred, _, _, _ = _make_alfred(tmp_path)
+    alfred.core.session_manager = session_manager
+    alfred.core.embedder = embedder
+
+    chunks = [chunk async for chunk in alfred.chat_stream("hello world")]
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert chunks == ["Hello", " world"]
+    assert requested.count("hello world") == 1
+    assert session.messages[0].content == "hello world"
+    assert session.messages[0].embedding == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_keeps_query_embedding_when_memory_store_is_empty(
+    tmp_path: Path,
+) -> None:
+    """An empty memory store still embeds the turn and stores the vector on the user message."""
+
+    alfred, context_loader, _, session_manager = _make_alfred(tmp_path)
+    alfred.core.memory_store = FakeMemoryStore(entries=[])
+
+    chunks = [chunk async for chunk in alfred.chat_stream("hello world")]
+
+    assert chunks == ["Hello", " world"]
+    assert alfred.core.embedder.calls == ["hello world"]
+    assert context_loader.calls[0]["memories_count"] == 0
+    user_message = next(message for message in session_manager.session.messages if message.content == "hello world")
+    assert user_message.embedding == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_coalesces_partial_message_snapshots(
+    tmp_path: Path,
+) -> None:
+    """Partial snapshots should be throttled while the final message stays complete."""
+
+    alfred, _, agent, session_manager = _make_alfred(tmp_path)
+    agent.chunks = ["Hello", " there", " world"]
+
+    partial_contents: list[str] = []
+    async for _chunk in alfred.chat_stream("hello world", persist_partial=True):
+        assistant_message = session_manager.session.messages[-1]
+        assert assistant_message.streaming is True
+        partial_contents.append(assistant_message.content)
+
+    # Chunks arrive back to back, so only the first one refreshes the snapshot.
+    assert partial_contents == ["Hello", "Hello", "Hello"]
+
+    assistant_message = session_manager.session.messages[-1]
+    assert assistant_message.streaming is False
+    assert assistant_message.content == "Hello there world"
+    assert assistant_message.text_blocks is not None
+    assert [block.content for block in assistant_message.text_blocks] == ["Hello there world"]
+
+
 @pytest.mark.asyncio
 async def test_chat_stream_includes_compiled_support_contract_in_system_prompt(
     tmp_path: Path,
@@ -215,6 +215,57 @@ class TestToolRegistryIntegration:
             assert "description" in schema["function"]
             assert "parameters" in schema["function"]
 
+    def test_get_tool_schemas_refreshes_when_registry_changes(self):
+        """Test that cached schemas follow register() and clear()."""
+        register_builtin_tools()
+        registry = get_registry()
+
+        assert registry.get_schemas() == registry.get_schemas()
+
+        registry.clear()
+        assert registry.get_schemas() == []
+
+        registry.register(BashTool())
+        assert [schema["function"]["name"] for schema in registry.get_schemas()] == ["bash"]
+
+    def test_system_prompt_tools_section_follows_registry_version(self):
+        """Test that Alfred re-renders the tool list only after the registry changes."""
+        from alfred.alfred import Alfred
+
+        registry = get_registry()
+        registry.register(BashTool())
+        alfred = object.__new__(Alfred)
+        alfred.tools = registry
+        alfred._tools_section = None
+
+        prompt = alfred._build_system_prompt("base")
+        assert "- bash(" in prompt
+        assert alfred._tools_section[0] == registry.version
+        assert alfred._build_system_prompt("base") == prompt
+
+        registry.register(ReadTool())
+        prompt = alfred._build_system_prompt("base")
+        assert "- bash(" in prompt
+        assert "- read(" in prompt
+
+    def test_param_summary_is_rendered_once_per_model(self):
+        """Test that parameter summaries keep the prompt format and are cached per model."""
+        from typing import Any
+
+        from pydantic import BaseModel
+
+        from alfred.alfred import _param_summary
+
+        class Params(BaseModel):
+            path: str
+            limit: int | None = None
+            extra: Any = None
+
+        assert _param_summary(Params) == "path: str, limit: int | none, extra: any"
+        hits = _param_summary.cache_info().hits
+        _param_summary(Params)
+        assert _param_summary.cache_info().hits == hits + 1
+
     def test_tool_execution_via_registry(self, temp_workspace):
         """Test executing tools through registry lookup."""
         register_builtin_tools()
@@ -14,6 +14,7 @@ from alfred.llm import (
     LLMFactory,
     RateLimitError,
     TimeoutError,
+    preload_token_encoder,
     retry_with_backoff,
 )
 
@@ -204,6 +205,25 @@ class TestRetryWithBackoff:
 
 
 # Tests for LLMFactory
+class TestPreloadTokenEncoder:
+    """Tests for warming the token encoder at startup."""
+
+    @pytest.mark.asyncio
+    async def test_loads_encoding_off_the_event_loop(self, monkeypatch):
+        """The encoding is loaded in a worker thread, not on the loop's thread."""
+        import threading
+
+        import tiktoken
+
+        calls: list[tuple[str, threading.Thread]] = []
+        monkeypatch.setattr(tiktoken, "get_encoding", lambda name: calls.append((name, threading.current_thread())))
+
+        await preload_token_encoder()
+
+        assert [name for name, _ in calls] == ["cl100k_base"]
+        assert calls[0][1] is not threading.current_thread()
+
+
 class TestLLMFactory:
     """Test LLMFactory without making API calls."""
 
@@ -184,7 +184,7 @@ async def test_context_building_with_memories(config, mock_store):
 
     context, memories_count = await context_builder.build_context(
         query_embedding=query_embedding,
-        memories=memory_entries,
+        available_memories=len(memory_entries),
         system_prompt=system_prompt,
         session_messages=[],
     )
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import io
 import logging
+import threading
+import time
 from contextlib import contextmanager, suppress
 
 from alfred.observability import (
@@ -9,6 +11,7 @@ from alfred.observability import (
     SurfaceFormatter,
     configure_logging,
     event_message,
+    log_event,
     surface_for_logger_name,
 )
 
@@ -95,6 +98,34 @@ def test_surface_formatter_colors_prefix_in_tty() -> None:
     assert formatted.endswith("event=turn.start")
 
 
+def test_surface_formatter_probes_tty_once_and_honors_no_color(monkeypatch) -> None:
+    class _CountingTtyBuffer(_TtyBuffer):
+        probes = 0
+
+        def isatty(self) -> bool:
+            type(self).probes += 1
+            return True
+
+    record = logging.LogRecord(
+        name="alfred.context",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="event=turn.start",
+        args=(),
+        exc_info=None,
+    )
+    formatter = SurfaceFormatter(kind="console", stream=_CountingTtyBuffer())
+    formatter.format(record)
+    formatter.format(record)
+    assert _CountingTtyBuffer.probes == 1
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    formatted = SurfaceFormatter(kind="console", stream=_TtyBuffer()).format(record)
+    assert "\x1b[" not in formatted
+    assert formatted.startswith("[core]")
+
+
 def test_surface_formatter_emits_plain_prefix_when_not_tty() -> None:
     formatter = SurfaceFormatter(kind="console", stream=_PlainBuffer())
     record = logging.LogRecord(
@@ -158,3 +189,52 @@ def test_configure_logging_respects_level_for_all_surfaces(tmp_path) -> None:
     assert "event=webui.hidden" not in file_output
     assert "event=webui.visible" in file_output
     assert "surface=webui-server" in file_output
+
+
+def test_log_event_skips_formatting_below_configured_level(tmp_path) -> None:
+    class _Unrenderable:
+        def __str__(self) -> str:
+            raise AssertionError("field rendered for a disabled level")
+
+        __repr__ = __str__
+
+    with _preserve_root_logging():
+        configure_logging(level=logging.WARNING, log_file=tmp_path / "alfred.log", stream=_PlainBuffer())
+        log_event(logging.getLogger("alfred.llm"), logging.DEBUG, "llm.hidden", surface=Surface.LLM, payload=_Unrenderable())
+
+
+def test_configure_logging_writes_records_off_the_calling_thread(tmp_path) -> None:
+    class _ThreadRecordingBuffer(_PlainBuffer):
+        writer_threads: set[str] = set()
+
+        def write(self, text: str) -> int:
+            self.writer_threads.add(threading.current_thread().name)
+            return super().write(text)
+
+    stream = _ThreadRecordingBuffer()
+
+    with _preserve_root_logging():
+        configure_logging(level=logging.INFO, log_file=tmp_path / "alfred.log", stream=stream)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("alfred.context").exception("event=turn.%s", "failed")
+
+    output = stream.getvalue()
+    assert "event=turn.failed" in output
+    assert "ValueError: boom" in output
+    assert threading.current_thread().name not in stream.writer_threads
+
+
+def test_configure_logging_flushes_buffered_records_once_idle(tmp_path) -> None:
+    stream = _PlainBuffer()
+
+    with _preserve_root_logging():
+        configure_logging(level=logging.INFO, log_file=tmp_path / "alfred.log", stream=stream)
+        logging.getLogger("alfred.context").info("event=turn.start")
+
+        deadline = time.monotonic() + 2.0
+        while "event=turn.start" not in stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "event=turn.start" in stream.getvalue()
@@ -465,3 +465,39 @@ def test_self_model_rebuilds_fresh_each_time():
 
     # Models should be independent
     assert model1.context_pressure.message_count == 1  # Unchanged
+
+
+def test_telegram_bot_is_created_lazily(monkeypatch):
+    """Telegram mode is detected up front while the bot client waits for first use."""
+    from types import SimpleNamespace
+
+    import telegram
+
+    from alfred.alfred import Alfred
+
+    created: list[str] = []
+
+    class FakeBot:
+        def __init__(self, token: str) -> None:
+            created.append(token)
+
+    monkeypatch.setattr(telegram, "Bot", FakeBot)
+
+    alfred = object.__new__(Alfred)
+    alfred.config = SimpleNamespace(telegram_bot_token="test-token")
+    alfred._telegram_mode = True
+    alfred._telegram_bot = None
+    alfred.tools = FakeTools([])
+    alfred.context_summary = FakeContextSummary(0, 0)
+    alfred.token_tracker = FakeTokenTracker(None)
+    alfred.core = FakeCore(True)
+
+    model = build_runtime_self_model(alfred)
+
+    assert model.runtime.interface == InterfaceType.WEBUI
+    assert created == []
+
+    bot = alfred.telegram_bot
+    assert isinstance(bot, FakeBot)
+    assert alfred.telegram_bot is bot
+    assert created == ["test-token"]
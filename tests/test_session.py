@@ -289,6 +289,25 @@ class TestSessionManager:
         assert messages[1].content == "Second"
         assert messages[2].content == "Third"
 
+    def test_context_messages_exclude_latest_message(self, initialized_manager: SessionManager):
+        """Context helpers skip the in-flight message and return independent lists."""
+        assert initialized_manager.get_messages_for_context() == []
+        assert initialized_manager.get_messages_with_tools_for_context() == []
+
+        session = initialized_manager.start_session()
+        assert initialized_manager.get_messages_for_context() == []
+
+        initialized_manager.add_message("user", "First")
+        initialized_manager.add_message("assistant", "Second")
+        initialized_manager.add_message("user", "Third")
+
+        assert initialized_manager.get_messages_for_context() == [("user", "First"), ("assistant", "Second")]
+        with_tools = initialized_manager.get_messages_with_tools_for_context(session.meta.session_id)
+        assert [message.content for message in with_tools] == ["First", "Second"]
+
+        with_tools.clear()
+        assert len(session.messages) == 3
+
     def test_text_blocks_round_trip_through_serialization(self, initialized_manager: SessionManager):
         """text_blocks should persist through session serialization."""
         initialized_manager.start_session()
@@ -419,6 +438,63 @@ class TestSessionManager:
             "Second draft",
         ]
 
+    @pytest.mark.asyncio
+    async def test_persist_embeds_pending_messages_in_one_batch(self, tmp_path: Path):
+        """Messages without embeddings are embedded with a single batch request."""
+        mock_sqlite_store = MagicMock()
+        mock_sqlite_store.save_session = AsyncMock(return_value=None)
+        embedder = MagicMock()
+        embedder.embed = AsyncMock()
+        embedder.embed_batch = AsyncMock(return_value=[[0.1], [0.2]])
+        manager = SessionManager(store=mock_sqlite_store, data_dir=tmp_path, embedder=embedder)
+
+        now = datetime.now()
+        messages = [
+            Message(idx=0, role=Role.USER, content="hello", timestamp=now, embedding=[0.0]),
+            Message(idx=1, role=Role.ASSISTANT, content="hi there", timestamp=now),
+            Message(idx=2, role=Role.USER, content="", timestamp=now),
+            Message(idx=3, role=Role.USER, content="how are you", timestamp=now),
+        ]
+
+        await manager._persist_messages_strict("sess_batch", messages)
+
+        embedder.embed_batch.assert_awaited_once_with(["hi there", "how are you"])
+        embedder.embed.assert_not_called()
+        assert [message.embedding for message in messages] == [[0.0], [0.1], None, [0.2]]
+        mock_sqlite_store.save_session.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_background_persists_coalesce_per_session(self, tmp_path: Path):
+        """Messages added while a save is queued or running share a single follow-up save."""
+        import asyncio
+
+        release = asyncio.Event()
+        saved_counts: list[int] = []
+
+        async def save_session(session_id, messages, metadata=None):
+            saved_counts.append(len(messages))
+            await release.wait()
+
+        mock_sqlite_store = MagicMock()
+        mock_sqlite_store.load_session = AsyncMock(return_value=None)
+        mock_sqlite_store.save_session = save_session
+        manager = SessionManager(store=mock_sqlite_store, data_dir=tmp_path)
+        manager.start_session()
+
+        manager.add_message("user", "one")
+        manager.add_message("assistant", "two")
+        await asyncio.sleep(0)
+        assert saved_counts == [2]
+
+        manager.add_message("user", "three")
+        manager.add_message("assistant", "four")
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert saved_counts == [2, 4]
+        assert manager._persist_tasks == {}
+
 
 class TestSessionManagerIsolation:
     """Tests for session isolation between instances."""
@@ -11,6 +11,7 @@ from alfred.cron.socket_protocol import (
     QueryJobsResponse,
     RejectJobRequest,
     RejectJobResponse,
+    SocketMessage,
     SubmitJobRequest,
     SubmitJobResponse,
 )
@@ -153,3 +154,17 @@ class TestSocketServerJobHandlers:
         await server._dispatch_message(request, mock_writer)
 
         mock_writer.write.assert_not_called()
+
+
+class TestSocketMessageParsing:
+    """Test parsing of raw socket lines."""
+
+    def test_from_json_parses_raw_line_bytes(self):
+        """A line read off the socket parses without decoding it first."""
+        request = SubmitJobRequest(request_id="req-1", name="Café job", expression="0 9 * * *", code="pass")
+
+        message = SocketMessage.from_json(request.to_json().encode("utf-8"))
+
+        assert isinstance(message, SubmitJobRequest)
+        assert message.name == "Café job"
+        assert message.request_id == "req-1"
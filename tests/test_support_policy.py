@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from alfred.embeddings import cosine_similarity
 from alfred.memory.support_learning import (
     LearningSituation,
     SupportAttempt,
@@ -297,6 +298,29 @@ async def test_support_turn_assessment_returns_one_need_and_ordered_subjects() -
     assert result.trace.subject_trace.accepted_subjects == result.assessment.subjects
 
 
+@pytest.mark.asyncio
+async def test_support_turn_assessment_similarities_match_pairwise_cosine() -> None:
+    """Matrix scoring should report the same cosine similarities as a pairwise comparison."""
+
+    turn_vector = (0.0, 0.95, 0.1, 0.0, 0.0, 0.0, 0.95, 0.8, 0.0, 0.0, 0.0, 0.2)
+    need_bank = _make_need_bank()
+    result = await assess_support_turn(
+        turn_text="Let's continue the Web UI cleanup work thread.",
+        embedder=FakeEmbedder({"Let's continue the Web UI cleanup work thread.": turn_vector}),
+        need_bank=need_bank,
+        need_thresholds=NEED_THRESHOLDS,
+        subject_prototypes=_make_subject_prototypes(),
+        subject_thresholds=SUBJECT_THRESHOLDS,
+    )
+
+    for score in result.trace.need_trace.centroid_scores:
+        assert score.similarity == pytest.approx(cosine_similarity(list(turn_vector), list(need_bank.centroids[score.need])))
+    prototypes_by_id = {prototype.prototype_id: prototype for prototype in need_bank.prototypes}
+    for neighbor in result.trace.need_trace.top_neighbors:
+        expected = cosine_similarity(list(turn_vector), list(prototypes_by_id[neighbor.prototype_id].vector))
+        assert neighbor.similarity == pytest.approx(expected)
+
+
 def test_support_response_mode_maps_unknown_and_subject_aware_assessments_to_existing_context_ids() -> None:
     """Unknown falls back to execute, while reflective and calibration cases map into existing context IDs."""
 
@@ -1,5 +1,6 @@
 """Tests for Telegram interface."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -182,6 +183,34 @@ async def test_message_surfaces_errors(
     assert mock_update.message.reply_text.return_value.edit_text.called
 
 
+@pytest.mark.asyncio
+async def test_message_streams_while_edit_in_flight(
+    mock_config: MagicMock,
+    mock_alfred: MagicMock,
+    mock_update: MagicMock,
+    mock_context: MagicMock,
+) -> None:
+    """Test that a slow progress edit does not stall consuming the stream."""
+    interface = TelegramInterface(mock_config, mock_alfred)
+    stream_done = asyncio.Event()
+
+    async def long_stream(message: str, session_id: str | None = None) -> AsyncIterator[str]:
+        for _ in range(3):
+            yield "x" * 60
+        stream_done.set()
+
+    async def slow_edit(text: str) -> None:
+        await stream_done.wait()
+
+    mock_alfred.chat_stream = long_stream
+    edit_text = mock_update.message.reply_text.return_value.edit_text
+    edit_text.side_effect = slow_edit
+
+    await asyncio.wait_for(interface.message(mock_update, mock_context), timeout=1.0)
+
+    assert edit_text.call_args_list[-1].args == ("x" * 180,)
+
+
 @pytest.mark.asyncio
 async def test_setup_creates_handlers(mock_config: MagicMock, mock_alfred: MagicMock) -> None:
     """Test that setup creates all required handlers."""
@@ -202,3 +231,24 @@ async def test_setup_creates_handlers(mock_config: MagicMock, mock_alfred: Magic
         assert result is mock_app
         # Should have 3 handlers: start, compact, message
         assert mock_app.add_handler.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_id_state_is_read_once_and_not_rewritten(
+    mock_config: MagicMock,
+    mock_alfred: MagicMock,
+    mock_update: MagicMock,
+    mock_context: MagicMock,
+    tmp_path,
+) -> None:
+    """Persisted chat_id is loaded once and an unchanged id is not saved again."""
+    state_file = tmp_path / "telegram_state.json"
+    state_file.write_text('{"chat_id": 12345}')
+    interface = TelegramInterface(mock_config, mock_alfred, data_dir=tmp_path)
+    interface._save_state = MagicMock()
+
+    await interface.message(mock_update, mock_context)
+
+    interface._save_state.assert_not_called()
+    state_file.unlink()
+    assert interface.chat_id == 12345
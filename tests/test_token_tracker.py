@@ -203,3 +203,16 @@ class TestTokenTracker:
         assert "input=100" in repr_str
         assert "output=50" in repr_str
         assert "context=5000" in repr_str
+
+
+def test_alfred_context_estimate_counts_message_content() -> None:
+    """Context tokens are estimated from prompt and message lengths, not their repr."""
+    from alfred.alfred import Alfred
+    from alfred.llm import ChatMessage
+
+    alfred = object.__new__(Alfred)
+    alfred.token_tracker = TokenTracker()
+
+    alfred._update_context_tokens("s" * 40, [ChatMessage(role="user", content="u" * 8)])
+
+    assert alfred.token_tracker.context_tokens == 12
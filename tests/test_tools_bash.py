@@ -88,6 +88,13 @@ class TestBashTool:
         assert "[Running:" in result
         assert "Line1" in result or "Line2" in result
 
+    @pytest.mark.asyncio
+    async def test_streaming_yields_collected_stdout_as_one_chunk(self, bash_tool):
+        """Test that multi-line stdout is not split into per-line chunks."""
+        chunks = [chunk async for chunk in bash_tool.execute_stream(command="seq 1 3")]
+
+        assert chunks[1:] == ["1\n2\n3\n"]
+
     @pytest.mark.asyncio
     async def test_streaming_timeout(self, bash_tool):
         """Test streaming with timeout."""
@@ -77,6 +77,20 @@ class TestEditTool:
         assert content.count("unique") == 1
         assert content.count("dup") == 2
 
+    def test_edit_reports_bytes_changed_and_rejects_no_op(self, edit_tool, temp_file):
+        """Test bytes_changed and that replacing text with itself is not an edit."""
+        with open(temp_file, "w") as f:
+            f.write("alpha beta gamma\n")
+
+        result = edit_tool.execute(path=temp_file, old_text="beta", new_text="BETA!!")
+        unchanged = edit_tool.execute(path=temp_file, old_text="gamma", new_text="gamma")
+
+        with open(temp_file) as f:
+            assert f.read() == "alpha BETA!! gamma\n"
+        assert result["bytes_changed"] == 2
+        assert unchanged["success"] is False
+        assert unchanged["edited"] is False
+
     def test_edit_nonexistent_file(self, edit_tool):
         """Test editing a file that doesn't exist."""
         result = edit_tool.execute(path="/nonexistent/file.txt", old_text="old", new_text="new")
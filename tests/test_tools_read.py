@@ -67,6 +67,18 @@ class TestReadTool:
         assert "Line 2" in result
         assert "Line 3" not in result
 
+    def test_read_with_limit_stops_before_rest_of_file(self, read_tool):
+        """Test that lines past offset/limit are never decoded."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+            f.write(b"Line 1\nLine 2\n" + b"x" * 100_000 + b"\n" + b"\xff\xfe" * 1000)
+            path = f.name
+
+        try:
+            result = read_tool.execute(path=path, limit=2)
+            assert result == "Line 1\nLine 2\n"
+        finally:
+            os.unlink(path)
+
     def test_read_nonexistent_file(self, read_tool):
         """Test reading a file that doesn't exist."""
         result = read_tool.execute(path="/nonexistent/path/file.txt")